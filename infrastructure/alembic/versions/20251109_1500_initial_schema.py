@@ -28,8 +28,8 @@ def upgrade() -> None:
         sa.Column('created_at', sa.DateTime(), nullable=False),
         sa.Column('updated_at', sa.DateTime(), nullable=False),
         sa.Column('created_by', sa.String(length=255), nullable=True),
-        sa.Column('design_intent', postgresql.JSON(astext_type=sa.Text()), nullable=False),
-        sa.Column('constraints', postgresql.JSON(astext_type=sa.Text()), nullable=True),
+        sa.Column('design_intent', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('constraints', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
         sa.Column('proposal_id', sa.String(length=100), nullable=True),
         sa.Column('error_message', sa.Text(), nullable=True),
         sa.PrimaryKeyConstraint('id'),
@@ -49,7 +49,7 @@ def upgrade() -> None:
         sa.Column('text', sa.Text(), nullable=False),
         sa.Column('language', sa.String(length=2), nullable=False),
         sa.Column('detected_role', sa.String(length=50), nullable=True),
-        sa.Column('metrics', postgresql.JSON(astext_type=sa.Text()), nullable=True),
+        sa.Column('metrics', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
         sa.Column('created_at', sa.DateTime(), nullable=False),
         sa.ForeignKeyConstraint(['session_id'], ['sessions.session_id'], ),
         sa.PrimaryKeyConstraint('id'),
@@ -69,7 +69,7 @@ def upgrade() -> None:
         sa.Column('height_px', sa.Integer(), nullable=False),
         sa.Column('alt_text', sa.String(length=500), nullable=False),
         sa.Column('content_role', sa.String(length=50), nullable=False),
-        sa.Column('dominant_palette', postgresql.JSON(astext_type=sa.Text()), nullable=True),
+        sa.Column('dominant_palette', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
         sa.Column('created_at', sa.DateTime(), nullable=False),
         sa.ForeignKeyConstraint(['session_id'], ['sessions.session_id'], ),
         sa.PrimaryKeyConstraint('id'),
@@ -0,0 +1,36 @@
+"""Add session lookup indexes on content_blocks and image_assets
+
+Revision ID: 003_add_session_lookup_indexes
+Revises: 002_convert_status_to_varchar
+Create Date: 2025-11-10 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003_add_session_lookup_indexes'
+down_revision: str = '002_convert_status_to_varchar'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Blocks are always read per session in sequence order (CIP build, responses),
+    # so this index finds a session's rows already sorted. The reads also need
+    # text and metrics, so they fetch from the heap regardless; a plain key keeps
+    # the index small and block inserts cheap.
+    op.create_index(
+        'ix_content_blocks_session_id_sequence',
+        'content_blocks',
+        ['session_id', 'sequence'],
+    )
+    op.create_index('ix_image_assets_session_id', 'image_assets', ['session_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_image_assets_session_id', table_name='image_assets')
+    op.drop_index('ix_content_blocks_session_id_sequence', table_name='content_blocks')
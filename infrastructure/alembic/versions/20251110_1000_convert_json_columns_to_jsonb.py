@@ -0,0 +1,49 @@
+"""Convert JSON columns to JSONB
+
+Revision ID: 004_convert_json_to_jsonb
+Revises: 003_add_session_lookup_indexes
+Create Date: 2025-11-10 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004_convert_json_to_jsonb'
+down_revision: str = '003_add_session_lookup_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_COLUMNS = [
+    ('sessions', 'design_intent'),
+    ('sessions', 'constraints'),
+    ('content_blocks', 'metrics'),
+    ('image_assets', 'dominant_palette'),
+]
+
+
+def _column_type(table: str, column: str) -> str:
+    """Return the PostgreSQL data type of a column."""
+    return op.get_bind().execute(
+        sa.text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_name = :table AND column_name = :column"
+        ),
+        {"table": table, "column": column},
+    ).scalar_one()
+
+
+def upgrade() -> None:
+    # Databases created from the current initial schema already use JSONB;
+    # only convert (and rewrite) tables that still store text-backed JSON
+    for table, column in JSON_COLUMNS:
+        if _column_type(table, column) == 'json':
+            op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb')
+
+
+def downgrade() -> None:
+    for table, column in JSON_COLUMNS:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} TYPE json USING {column}::json')
@@ -0,0 +1,39 @@
+"""Add CHECK constraint on session status
+
+Revision ID: 005_add_session_status_check
+Revises: 004_convert_json_to_jsonb
+Create Date: 2025-11-10 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005_add_session_status_check'
+down_revision: str = '004_convert_json_to_jsonb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Restrict the VARCHAR from migration 002 to the known lifecycle states.
+    # NOT VALID makes the ADD a metadata-only change under ACCESS EXCLUSIVE.
+    # env.py runs a migration in one transaction, so the VALIDATE scan goes in
+    # an autocommit block: that commits the ADD (releasing its lock) first, and
+    # existing rows are then checked under SHARE UPDATE EXCLUSIVE only.
+    op.execute("""
+        ALTER TABLE sessions ADD CONSTRAINT sessions_status_check
+        CHECK (status IN (
+            'draft', 'normalizing', 'ready', 'layout_queued',
+            'layout_processing', 'layout_complete', 'failed'
+        )) NOT VALID
+    """)
+    with op.get_context().autocommit_block():
+        op.execute('ALTER TABLE sessions VALIDATE CONSTRAINT sessions_status_check')
+
+
+def downgrade() -> None:
+    op.drop_constraint('sessions_status_check', 'sessions', type_='check')
@@ -0,0 +1,37 @@
+"""Add denormalized block and image counts to sessions
+
+Revision ID: 006_add_session_child_counts
+Revises: 005_add_session_status_check
+Create Date: 2025-11-10 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006_add_session_child_counts'
+down_revision: str = '005_add_session_status_check'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A constant server default is a metadata-only change on PostgreSQL 11+,
+    # so adding the columns does not rewrite the sessions table
+    op.add_column('sessions', sa.Column('block_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('sessions', sa.Column('image_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill existing sessions; child rows are never added after creation
+    op.execute("""
+        UPDATE sessions s
+        SET block_count = (SELECT count(*) FROM content_blocks b WHERE b.session_id = s.session_id),
+            image_count = (SELECT count(*) FROM image_assets i WHERE i.session_id = s.session_id)
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('sessions', 'image_count')
+    op.drop_column('sessions', 'block_count')
@@ -0,0 +1,40 @@
+"""Add index on idempotency key expiry
+
+Revision ID: 007_add_idempotency_expiry_index
+Revises: 006_add_session_child_counts
+Create Date: 2025-11-10 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007_add_idempotency_expiry_index'
+down_revision: str = '006_add_session_child_counts'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Expired keys are purged by range on expires_at. CONCURRENTLY cannot run
+    # inside a transaction, and it avoids blocking writes to the table the
+    # create-session path inserts into.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_idempotency_keys_expires_at',
+            'idempotency_keys',
+            ['expires_at'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_idempotency_keys_expires_at',
+            table_name='idempotency_keys',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,39 @@
+"""Assign row timestamps with server defaults
+
+Revision ID: 008_timestamp_server_defaults
+Revises: 007_add_idempotency_expiry_index
+Create Date: 2025-11-10 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008_timestamp_server_defaults'
+down_revision: str = '007_add_idempotency_expiry_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs whose value is now assigned by PostgreSQL on INSERT
+TIMESTAMP_COLUMNS = [
+    ('sessions', 'created_at'),
+    ('sessions', 'updated_at'),
+    ('content_blocks', 'created_at'),
+    ('image_assets', 'created_at'),
+    ('idempotency_keys', 'created_at'),
+]
+
+
+def upgrade() -> None:
+    # Columns stay TIMESTAMP WITHOUT TIME ZONE holding UTC, so the default
+    # converts now() explicitly instead of relying on the session TimeZone
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=sa.text("timezone('utc', now())"))
+
+
+def downgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=None)
@@ -9,7 +9,7 @@ import sys
 from pathlib import Path
 
 # Add project root to path
-project_root = Path(__file__).parent.parent
+project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(project_root))
 
 from alembic import command
@@ -25,16 +25,12 @@ def run_migrations() -> None:
     """Run Alembic migrations."""
     logger.info("Running database migrations...")
 
-    # Alembic needs to be run from the infrastructure directory
-    # because script_location is relative to alembic.ini location
-    import os
-    original_dir = os.getcwd()
-    try:
-        os.chdir("infrastructure")
-        alembic_cfg = Config("alembic.ini")
-        command.upgrade(alembic_cfg, "head")
-    finally:
-        os.chdir(original_dir)
+    # Resolve script_location against the project root instead of changing
+    # the working directory, so concurrent callers in one process are safe
+    infrastructure_dir = project_root / "infrastructure"
+    alembic_cfg = Config(str(infrastructure_dir / "alembic.ini"))
+    alembic_cfg.set_main_option("script_location", str(infrastructure_dir / "alembic"))
+    command.upgrade(alembic_cfg, "head")
 
     logger.info("Migrations completed successfully")
 
@@ -5,19 +5,21 @@ Provides REST endpoints for creating, retrieving, submitting, and managing
 intake sessions according to the OpenAPI specification.
 """
 
-from fastapi import APIRouter, HTTPException, Header, status, Depends
+from fastapi import APIRouter, HTTPException, Header, Request, status, Depends
 from typing import Annotated
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
 from services.content_intake.models.session import (
     CreateSessionRequest,
-    Session as SessionResponse,
     SessionResponse as SessionResponseModel,
     SubmitSessionRequest,
     ArtifactsResponse,
 )
-from services.content_intake.services.session_service import SessionService
+from services.content_intake.services.session_service import (
+    SessionNotFoundError,
+    SessionService,
+)
 from services.content_intake.database.connection import get_db
 
 logger = logging.getLogger(__name__)
@@ -25,12 +27,21 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-def get_session_service(db: Session = Depends(get_db)) -> SessionService:
-    """Dependency to get session service with database session."""
-    return SessionService(db)
+def get_session_service(request: Request, db: AsyncSession = Depends(get_db)) -> SessionService:
+    """Dependency to get session service with database session and shared HTTP clients."""
+    return SessionService(
+        db,
+        gestalt_client=request.app.state.gestalt_client,
+        formatter_client=request.app.state.formatter_client,
+    )
 
 
-@router.post("/sessions", response_model=SessionResponseModel, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/sessions",
+    response_model=SessionResponseModel,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_201_CREATED,
+)
 async def create_session(
     request: CreateSessionRequest,
     idempotency_key: Annotated[str | None, Header()] = None,
@@ -43,13 +54,7 @@ async def create_session(
     Returns session_id for subsequent operations.
     """
     try:
-        session = await service.create_session(request, idempotency_key)
-        return SessionResponseModel(
-            session_id=session.session_id,
-            status=session.status,
-            created_at=session.created_at,
-            proposal_id=session.proposal_id,
-        )
+        return await service.create_session(request, idempotency_key)
     except ValueError as e:
         logger.warning(f"Validation error creating session: {e}", exc_info=True)
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
@@ -58,7 +63,11 @@ async def create_session(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
-@router.get("/sessions/{session_id}", response_model=SessionResponseModel)
+@router.get(
+    "/sessions/{session_id}",
+    response_model=SessionResponseModel,
+    response_model_exclude_none=True,
+)
 async def get_session(
     session_id: str,
     service: SessionService = Depends(get_session_service),
@@ -72,16 +81,14 @@ async def get_session(
     if not session:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
 
-    return SessionResponseModel(
-        session_id=session.session_id,
-        status=session.status,
-        created_at=session.created_at,
-        proposal_id=session.proposal_id,
-        error_message=session.error_message,
-    )
+    return session
 
 
-@router.post("/sessions/{session_id}/submit", response_model=SessionResponseModel)
+@router.post(
+    "/sessions/{session_id}/submit",
+    response_model=SessionResponseModel,
+    response_model_exclude_none=True,
+)
 async def submit_session(
     session_id: str,
     request: SubmitSessionRequest | None = None,
@@ -95,22 +102,20 @@ async def submit_session(
     """
     try:
         request = request or SubmitSessionRequest()
-        updated_session = await service.submit_session(
-            session_id, request.layout_mode, idempotency_key
-        )
-        return SessionResponseModel(
-            session_id=updated_session.session_id,
-            status=updated_session.status,
-            created_at=updated_session.created_at,
-            proposal_id=updated_session.proposal_id,
-        )
+        return await service.submit_session(session_id, request.layout_mode, idempotency_key)
+    except SessionNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
-@router.post("/sessions/{session_id}/check-status", response_model=SessionResponseModel)
+@router.post(
+    "/sessions/{session_id}/check-status",
+    response_model=SessionResponseModel,
+    response_model_exclude_none=True,
+)
 async def check_proposal_status(
     session_id: str,
     service: SessionService = Depends(get_session_service),
@@ -122,15 +127,11 @@ async def check_proposal_status(
     and updates the session status accordingly.
     """
     try:
-        updated_session = await service.check_proposal_status(session_id)
-        return SessionResponseModel(
-            session_id=updated_session.session_id,
-            status=updated_session.status,
-            created_at=updated_session.created_at,
-            proposal_id=updated_session.proposal_id,
-            error_message=updated_session.error_message,
-        )
+        return await service.check_proposal_status(session_id)
+    except SessionNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except ValueError as e:
+        # Upstream Gestalt errors (e.g. unknown proposal) still arrive as plain ValueError
         error_msg = str(e).lower()
         if "not found" in error_msg:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -150,12 +151,10 @@ async def list_artifacts(
 
     Returns layout specifications and final document artifact IDs.
     """
-    # First check if session exists
-    session = await service.get_session(session_id)
-    if not session:
+    artifacts = await service.get_artifacts(session_id)
+    if artifacts is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
 
-    artifacts = await service.get_artifacts(session_id)
     return ArtifactsResponse(session_id=session_id, artifacts=artifacts)
 
 
@@ -171,12 +170,9 @@ async def delete_session(
     """
     try:
         await service.delete_session(session_id)
+    except SessionNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except ValueError as e:
-        # Check if it's "not found" error or "cannot delete" error
-        error_msg = str(e).lower()
-        if "not found" in error_msg:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-        else:
-            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
@@ -5,6 +5,7 @@ Handles communication with the Document Formatter API for document rendering.
 """
 
 import httpx
+import orjson
 from typing import Any
 import logging
 
@@ -12,6 +13,8 @@ from services.content_intake.utils.config import settings
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class FormatterClient:
     """Client for Document Formatter Service API."""
@@ -26,90 +29,100 @@ class FormatterClient:
         """
         self.base_url = base_url or settings.DOCUMENT_FORMATTER_URL
         self.timeout = timeout
-
-    async def render_document(self, lsp: dict[str, Any]) -> dict[str, Any]:
+        # One pooled client per process: keeps TCP connections alive across calls
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    async def _post_lsp(self, path: str, lsp: dict[str, Any] | bytes) -> dict[str, Any]:
         """
-        Render Word document from Layout Specification Package.
+        Post a Layout Specification Package and decode the JSON response.
 
         Args:
-            lsp: Layout Specification Package dictionary
+            path: Render endpoint path relative to the client base URL
+            lsp: Layout Specification Package dictionary, or its raw JSON bytes
+                which are spliced into the request body without re-encoding
 
         Returns:
-            Render job response with render_job_id and artifact_id
+            Decoded render job response
 
         Raises:
-            httpx.HTTPError: If request fails
-            ValueError: If response is invalid
+            ValueError: If the request is rejected or the formatter is unreachable
         """
-        url = f"{self.base_url}/v1/render/documents"
+        if isinstance(lsp, bytes):
+            body = b'{"layout_specification":' + lsp + b"}"
+        else:
+            body = orjson.dumps({"layout_specification": lsp})
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                logger.info(f"Submitting LSP to Document Formatter: {url}")
-                response = await client.post(url, json={"layout_specification": lsp})
-                response.raise_for_status()
-
-                data = response.json()
-                logger.info(
-                    f"Document render job created: {data.get('render_job_id')} "
-                    f"(status: {data.get('status')})"
-                )
-                return data
+            response = await self._client.post(path, content=body, headers=_JSON_HEADERS)
+            response.raise_for_status()
+            return orjson.loads(response.content)
 
         except httpx.HTTPStatusError as e:
             logger.error(
-                f"Document Formatter returned error: {e.response.status_code} - {e.response.text}"
+                "Document Formatter returned error: %s - %s", e.response.status_code, e.response.text
             )
             raise ValueError(
                 f"Document Formatter rejected request: {e.response.status_code} - {e.response.text}"
             )
         except httpx.RequestError as e:
-            logger.error(f"Failed to connect to Document Formatter: {e}")
+            logger.error("Failed to connect to Document Formatter: %s", e)
             raise ValueError(f"Cannot reach Document Formatter at {self.base_url}: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error calling Document Formatter: {e}")
+        except Exception:
+            logger.error("Unexpected error calling Document Formatter", exc_info=True)
             raise
 
-    async def render_presentation(self, lsp: dict[str, Any]) -> dict[str, Any]:
+    async def render_document(self, lsp: dict[str, Any] | bytes) -> dict[str, Any]:
         """
-        Render PowerPoint presentation from Layout Specification Package.
+        Render Word document from Layout Specification Package.
 
         Args:
-            lsp: Layout Specification Package dictionary
+            lsp: Layout Specification Package dictionary, or raw JSON bytes as
+                returned by GestaltClient.get_specification_bytes
 
         Returns:
-            Render job response with render_job_id and artifact_id
+            Queued render job response; poll /v1/render/jobs/{render_job_id} for the artifact_id
 
         Raises:
-            httpx.HTTPError: If request fails
-            ValueError: If response is invalid
+            ValueError: If the request is rejected or the formatter is unreachable
+        """
+        logger.info("Submitting LSP to Document Formatter: %s/v1/render/documents", self.base_url)
+        data = await self._post_lsp("/v1/render/documents", lsp)
+        logger.info(
+            "Document render job created: %s (status: %s)",
+            data.get("render_job_id"),
+            data.get("status"),
+        )
+        return data
+
+    async def render_presentation(self, lsp: dict[str, Any] | bytes) -> dict[str, Any]:
         """
-        url = f"{self.base_url}/v1/render/presentations"
+        Render PowerPoint presentation from Layout Specification Package.
 
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                logger.info(f"Submitting LSP to Document Formatter for PPTX: {url}")
-                response = await client.post(url, json={"layout_specification": lsp})
-                response.raise_for_status()
-
-                data = response.json()
-                logger.info(
-                    f"Presentation render job created: {data.get('render_job_id')} "
-                    f"(status: {data.get('status')})"
-                )
-                return data
+        Args:
+            lsp: Layout Specification Package dictionary, or raw JSON bytes as
+                returned by GestaltClient.get_specification_bytes
 
-        except httpx.HTTPStatusError as e:
-            logger.error(
-                f"Document Formatter returned error: {e.response.status_code} - {e.response.text}"
-            )
-            raise ValueError(
-                f"Document Formatter rejected request: {e.response.status_code} - {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            logger.error(f"Failed to connect to Document Formatter: {e}")
-            raise ValueError(f"Cannot reach Document Formatter at {self.base_url}: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error calling Document Formatter: {e}")
-            raise
+        Returns:
+            Queued render job response; poll /v1/render/jobs/{render_job_id} for the artifact_id
 
+        Raises:
+            ValueError: If the request is rejected or the formatter is unreachable
+        """
+        logger.info(
+            "Submitting LSP to Document Formatter for PPTX: %s/v1/render/presentations", self.base_url
+        )
+        data = await self._post_lsp("/v1/render/presentations", lsp)
+        logger.info(
+            "Presentation render job created: %s (status: %s)",
+            data.get("render_job_id"),
+            data.get("status"),
+        )
+        return data
@@ -5,9 +5,13 @@ Handles communication with the Gestalt Design Engine API for layout generation.
 """
 
 import httpx
+import orjson
+from collections.abc import Iterable, Sequence
 from typing import Any
 import logging
 
+from services.content_intake.models.proposal import ProposalResponse
+from services.content_intake.utils.cache import TTLCache
 from services.content_intake.utils.config import settings
 
 logger = logging.getLogger(__name__)
@@ -16,68 +20,139 @@ logger = logging.getLogger(__name__)
 class GestaltClient:
     """Client for Gestalt Design Engine API."""
 
-    def __init__(self, base_url: str | None = None, timeout: float = 30.0) -> None:
+    def __init__(
+        self,
+        base_url: str | None = None,
+        timeout: float = 30.0,
+        idempotency_cache_size: int = 1024,
+        idempotency_cache_ttl: float = 600.0,
+    ) -> None:
         """
         Initialize Gestalt client.
 
         Args:
             base_url: Base URL for Gestalt Engine API (defaults to config)
             timeout: Request timeout in seconds
+            idempotency_cache_size: Maximum idempotency keys remembered
+            idempotency_cache_ttl: Seconds an idempotent body or response is reused
         """
         self.base_url = base_url or settings.GESTALT_ENGINE_URL
         self.timeout = timeout
+        # Idempotency keys guarantee identical CIPs: keep the encoded body until
+        # the POST succeeds, then the proposal so duplicates skip the POST entirely
+        self._body_cache: TTLCache[str, bytes] = TTLCache(
+            idempotency_cache_size, idempotency_cache_ttl
+        )
+        self._proposal_cache: TTLCache[str, ProposalResponse] = TTLCache(
+            idempotency_cache_size, idempotency_cache_ttl
+        )
+        # One pooled client per process: keeps TCP connections alive across calls
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        not_found_message: str | None = None,
+    ) -> bytes:
+        """
+        Send a request to the Gestalt Engine and return the raw JSON response body.
+
+        Args:
+            method: HTTP method
+            path: Path relative to the client base URL
+            content: Pre-encoded request body
+            headers: Extra request headers
+            not_found_message: For lookups, the error raised on 404; other
+                status errors are re-raised unchanged. When omitted, every
+                status error is reported as a rejected request.
+
+        Returns:
+            Undecoded JSON response body, so callers pick the decoder
+
+        Raises:
+            httpx.HTTPStatusError: If a lookup fails with a non-404 status
+            ValueError: If the request is rejected, not found, or cannot be sent
+        """
+        try:
+            response = await self._client.request(method, path, content=content, headers=headers)
+            response.raise_for_status()
+            return response.content
+
+        except httpx.HTTPStatusError as e:
+            status_code = e.response.status_code
+            if not_found_message is not None:
+                if status_code == 404:
+                    raise ValueError(not_found_message)
+                logger.error("Gestalt Engine returned error: %s", status_code)
+                raise
+            logger.error("Gestalt Engine returned error: %s - %s", status_code, e.response.text)
+            raise ValueError(f"Gestalt Engine rejected request: {status_code} - {e.response.text}")
+        except httpx.RequestError as e:
+            logger.error("Failed to connect to Gestalt Engine: %s", e)
+            raise ValueError(f"Cannot reach Gestalt Engine at {self.base_url}: {e}")
+        except Exception:
+            logger.error("Unexpected error calling Gestalt Engine", exc_info=True)
+            raise
 
     async def create_proposal(
         self, cip: dict[str, Any], idempotency_key: str | None = None
-    ) -> dict[str, Any]:
+    ) -> ProposalResponse:
         """
         Submit Content-Intent Package to Gestalt Engine for layout generation.
 
+        With an idempotency key, a proposal already created for that key is
+        returned without calling the engine, and retries after a failed POST
+        reuse the previously encoded body.
+
         Args:
             cip: Content-Intent Package (CIP) dictionary
             idempotency_key: Optional idempotency key for request deduplication
 
         Returns:
-            Proposal response with proposal_id and status
+            Typed proposal response with proposal_id and status
 
         Raises:
-            httpx.HTTPError: If request fails
-            ValueError: If response is invalid
+            ValueError: If the request is rejected or the engine is unreachable
         """
-        url = f"{self.base_url}/layout/proposals"
-
         headers = {"Content-Type": "application/json"}
+        body = None
         if idempotency_key:
             headers["Idempotency-Key"] = idempotency_key
-
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                logger.info(f"Submitting CIP to Gestalt Engine: {url}")
-                response = await client.post(url, json=cip, headers=headers)
-                response.raise_for_status()
-
-                data = response.json()
-                logger.info(
-                    f"Gestalt proposal created: {data.get('proposal_id')} "
-                    f"(status: {data.get('status')})"
-                )
-                return data
-
-        except httpx.HTTPStatusError as e:
-            logger.error(
-                f"Gestalt Engine returned error: {e.response.status_code} - {e.response.text}"
-            )
-            raise ValueError(
-                f"Gestalt Engine rejected request: {e.response.status_code} - {e.response.text}"
+            cached = self._proposal_cache.get(idempotency_key)
+            if cached is not None:
+                logger.info("Reusing Gestalt proposal %s for idempotency key", cached.proposal_id)
+                return cached
+            body = self._body_cache.get(idempotency_key)
+            if body is None:
+                body = orjson.dumps(cip)
+                self._body_cache.set(idempotency_key, body)
+
+        logger.info("Submitting CIP to Gestalt Engine: %s/layout/proposals", self.base_url)
+        data = ProposalResponse.model_validate_json(
+            await self._request(
+                "POST", "/layout/proposals", content=body or orjson.dumps(cip), headers=headers
             )
-        except httpx.RequestError as e:
-            logger.error(f"Failed to connect to Gestalt Engine: {e}")
-            raise ValueError(f"Cannot reach Gestalt Engine at {self.base_url}: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error calling Gestalt Engine: {e}")
-            raise
+        )
+        logger.info("Gestalt proposal created: %s (status: %s)", data.proposal_id, data.status)
+
+        if idempotency_key:
+            self._body_cache.pop(idempotency_key)
+            self._proposal_cache.set(idempotency_key, data)
+        return data
 
-    async def get_proposal_status(self, proposal_id: str) -> dict[str, Any]:
+    async def get_proposal_status(self, proposal_id: str) -> ProposalResponse:
         """
         Get proposal status from Gestalt Engine.
 
@@ -90,22 +165,12 @@ class GestaltClient:
         Raises:
             httpx.HTTPError: If request fails
         """
-        url = f"{self.base_url}/layout/proposals/{proposal_id}"
-
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                return response.json()
-
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise ValueError(f"Proposal {proposal_id} not found")
-            logger.error(f"Gestalt Engine returned error: {e.response.status_code}")
-            raise
-        except httpx.RequestError as e:
-            logger.error(f"Failed to connect to Gestalt Engine: {e}")
-            raise ValueError(f"Cannot reach Gestalt Engine at {self.base_url}: {e}")
+        body = await self._request(
+            "GET",
+            f"/layout/proposals/{proposal_id}",
+            not_found_message=f"Proposal {proposal_id} not found",
+        )
+        return ProposalResponse.model_validate_json(body)
 
     async def get_specification(self, proposal_id: str) -> dict[str, Any]:
         """
@@ -120,38 +185,50 @@ class GestaltClient:
         Raises:
             httpx.HTTPError: If request fails
         """
-        url = f"{self.base_url}/layout/proposals/{proposal_id}/spec"
+        return orjson.loads(await self.get_specification_bytes(proposal_id))
 
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                return response.json()
+    async def get_specification_bytes(self, proposal_id: str) -> bytes:
+        """
+        Get the Layout Specification Package as undecoded JSON bytes.
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise ValueError(f"Specification for proposal {proposal_id} not found")
-            logger.error(f"Gestalt Engine returned error: {e.response.status_code}")
-            raise
-        except httpx.RequestError as e:
-            logger.error(f"Failed to connect to Gestalt Engine: {e}")
-            raise ValueError(f"Cannot reach Gestalt Engine at {self.base_url}: {e}")
+        Use this when the LSP is only forwarded (e.g. to the Document Formatter),
+        so it is never decoded into a dict and re-encoded.
+
+        Args:
+            proposal_id: Proposal identifier
+
+        Returns:
+            Layout Specification Package JSON body
+
+        Raises:
+            ValueError: If the specification is not found or the engine is unreachable
+        """
+        return await self._request(
+            "GET",
+            f"/layout/proposals/{proposal_id}/spec",
+            not_found_message=f"Specification for proposal {proposal_id} not found",
+        )
 
     def build_cip(
         self,
         session_id: str,
-        content_blocks: list[dict[str, Any]],
-        images: list[dict[str, Any]],
+        content_blocks: Iterable[Sequence[Any]],
+        images: Iterable[Sequence[Any]],
         design_intent: dict[str, Any],
         constraints: dict[str, Any],
     ) -> dict[str, Any]:
         """
         Build Content-Intent Package (CIP) from session data.
 
+        Rows are unpacked positionally, so they can be SQL result rows selected
+        with exactly these columns and no per-key lookups are needed.
+
         Args:
             session_id: Session ID
-            content_blocks: List of content blocks
-            images: List of image assets
+            content_blocks: Block rows of (block_id, type, level, sequence, text,
+                language, detected_role, metrics), ordered by sequence
+            images: Image rows of (image_id, uri, format, width_px, height_px,
+                alt_text, content_role, dominant_palette)
             design_intent: Design intent configuration
             constraints: Layout constraints
 
@@ -164,29 +241,33 @@ class GestaltClient:
             "content": {
                 "blocks": [
                     {
-                        "block_id": block["block_id"],
-                        "type": block["type"],
-                        "level": block.get("level", 0),
-                        "sequence": block["sequence"],
-                        "text": block["text"],
-                        "language": block.get("language", "en"),
-                        "detected_role": block.get("detected_role"),
-                        "metrics": block.get("metrics", {}),
+                        "block_id": block_id,
+                        "type": block_type,
+                        "level": level,
+                        "sequence": sequence,
+                        "text": text,
+                        "language": language or "en",
+                        "detected_role": detected_role,
+                        "metrics": metrics or {},
                     }
-                    for block in content_blocks
+                    for (
+                        block_id, block_type, level, sequence, text, language, detected_role, metrics
+                    ) in content_blocks
                 ],
                 "images": [
                     {
-                        "image_id": image["image_id"],
-                        "uri": image["uri"],
-                        "format": image["format"],
-                        "width_px": image["width_px"],
-                        "height_px": image["height_px"],
-                        "alt_text": image.get("alt_text"),
-                        "content_role": image.get("content_role"),
-                        "dominant_palette": image.get("dominant_palette", []),
+                        "image_id": image_id,
+                        "uri": uri,
+                        "format": image_format,
+                        "width_px": width_px,
+                        "height_px": height_px,
+                        "alt_text": alt_text,
+                        "content_role": content_role,
+                        "dominant_palette": dominant_palette or [],
                     }
-                    for image in images
+                    for (
+                        image_id, uri, image_format, width_px, height_px, alt_text, content_role, dominant_palette
+                    ) in images
                 ],
             },
             "design_intent": design_intent,
@@ -1,42 +1,83 @@
 """Database configuration and connection management."""
 
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from sqlalchemy.pool import NullPool
+from typing import Any, AsyncGenerator
+from uuid import uuid4
 
 from services.content_intake.utils.config import settings
 
+# DATABASE_URL is shared with Alembic (sync psycopg2); the API process talks
+# to the same database through the asyncpg driver
+ASYNC_DATABASE_URL = make_url(settings.DATABASE_URL).set(drivername="postgresql+asyncpg")
+
+
+def _json_serializer(value: Any) -> str:
+    """Encode JSONB column values with orjson instead of the stdlib json module."""
+    return orjson.dumps(value).decode()
+
+
 # Create database engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+if settings.DB_PGBOUNCER:
+    # PgBouncer owns the pool in transaction mode: every transaction may land on
+    # a different server connection, so neither pooling nor prepared statements
+    # can be kept on the client side. SQLAlchemy still prepares each statement
+    # under a name; unique names keep one client's statement from colliding
+    # with another's on a shared server connection ("prepared statement
+    # ... already exists").
+    _pool_options: dict[str, Any] = {
+        "poolclass": NullPool,
+        "connect_args": {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        },
+    }
+else:
+    _pool_options = {
+        "pool_pre_ping": True,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+    }
+
+engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    # Compiled SQL cache shared by all sessions; sized above the default 500
+    # so the hot-path session statements never get evicted
+    query_cache_size=1200,
     echo=settings.LOG_LEVEL == "DEBUG",
+    # design_intent, constraints, metrics and dominant_palette are JSONB and
+    # are encoded/decoded on every write and read
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    **_pool_options,
 )
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = async_sessionmaker(
+    bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
 
 # Base class for declarative models
 Base = declarative_base()
 
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency function to get database session.
 
     Yields:
-        Database session that auto-closes after use
+        Async database session that auto-closes after use
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def init_db() -> None:
+async def init_db() -> None:
     """Initialize database - create all tables."""
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
@@ -1,12 +1,17 @@
 """SQLAlchemy database models for Content Intake Service."""
 
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, DateTime, Enum as SQLEnum, ForeignKey, JSON, Text, TypeDecorator
+from sqlalchemy import CheckConstraint, Column, String, Integer, DateTime, ForeignKey, Index, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 import enum
 
 from services.content_intake.database.connection import Base
 
+# Timestamps are assigned by PostgreSQL rather than per row in Python; they
+# stay naive UTC to match the datetime.utcnow() values the service compares with
+_UTC_NOW = text("timezone('utc', now())")
+
 
 class SessionStatusEnum(str, enum.Enum):
     """Session lifecycle states."""
@@ -19,59 +24,54 @@ class SessionStatusEnum(str, enum.Enum):
     FAILED = "failed"
 
 
-class SessionStatusEnumType(TypeDecorator):
-    """Custom type decorator to ensure enum values are used."""
-    # Use String instead of native enum to avoid PostgreSQL enum name/value issues
-    impl = String(50)
-    cache_ok = True
-
-    def process_bind_param(self, value, dialect):
-        """Convert enum to its value when binding to database."""
-        if value is None:
-            return None
-        if isinstance(value, SessionStatusEnum):
-            return value.value
-        # If it's already a string (enum value), return as-is
-        if isinstance(value, str):
-            return value
-        return str(value)
-
-    def process_result_value(self, value, dialect):
-        """Convert database value back to string (not enum object)."""
-        if value is None:
-            return None
-        # Always return the string value, not the enum object
-        # This prevents issues when converting to Pydantic enums
-        if isinstance(value, SessionStatusEnum):
-            return value.value
-        if isinstance(value, str):
-            return value  # Already a string, return as-is
-        return str(value)
-
-
 class SessionModel(Base):
     """Database model for intake sessions."""
 
     __tablename__ = "sessions"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ({})".format(", ".join(f"'{status.value}'" for status in SessionStatusEnum)),
+            name="sessions_status_check",
+        ),
+    )
+    # Fetch server-generated timestamps with RETURNING on INSERT, so a new
+    # session can be returned without reloading it
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     session_id = Column(String(100), unique=True, index=True, nullable=False)
-    status = Column(SessionStatusEnumType, default=SessionStatusEnum.DRAFT.value, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Plain VARCHAR holding SessionStatusEnum values; sessions_status_check
+    # rejects anything else, so no per-row type conversion is needed
+    status = Column(String(50), default=SessionStatusEnum.DRAFT.value, nullable=False)
+    created_at = Column(DateTime, server_default=_UTC_NOW, nullable=False)
+    updated_at = Column(DateTime, server_default=_UTC_NOW, onupdate=datetime.utcnow, nullable=False)
     created_by = Column(String(255), nullable=True)
 
-    # Intent and constraints stored as JSON
-    design_intent = Column(JSON, nullable=False)
-    constraints = Column(JSON, nullable=True)
+    # Intent and constraints stored as JSONB
+    design_intent = Column(JSONB, nullable=False)
+    constraints = Column(JSONB, nullable=True)
+
+    # Child row counts, written once at creation so readers can skip the child tables
+    block_count = Column(Integer, default=0, server_default="0", nullable=False)
+    image_count = Column(Integer, default=0, server_default="0", nullable=False)
 
     # Downstream references
     proposal_id = Column(String(100), nullable=True)
     error_message = Column(Text, nullable=True)
 
-    # Relationships
-    content_blocks = relationship("ContentBlockModel", back_populates="session", cascade="all, delete-orphan")
-    images = relationship("ImageAssetModel", back_populates="session", cascade="all, delete-orphan")
+    # Relationships. lazy="raise" makes any access that was not eager-loaded
+    # (see SessionService._load_session) fail loudly instead of issuing
+    # per-session SELECTs
+    content_blocks = relationship(
+        "ContentBlockModel",
+        back_populates="session",
+        cascade="all, delete-orphan",
+        order_by="ContentBlockModel.sequence",
+        lazy="raise",
+    )
+    images = relationship(
+        "ImageAssetModel", back_populates="session", cascade="all, delete-orphan", lazy="raise"
+    )
 
     def __repr__(self) -> str:
         return f"<Session {self.session_id} status={self.status}>"
@@ -81,6 +81,9 @@ class ContentBlockModel(Base):
     """Database model for content blocks."""
 
     __tablename__ = "content_blocks"
+    __table_args__ = (
+        Index("ix_content_blocks_session_id_sequence", "session_id", "sequence"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     block_id = Column(String(100), unique=True, index=True, nullable=False)
@@ -93,10 +96,10 @@ class ContentBlockModel(Base):
     language = Column(String(2), default="en", nullable=False)
     detected_role = Column(String(50), nullable=True)
 
-    # Metrics stored as JSON
-    metrics = Column(JSON, nullable=True)
+    # Metrics stored as JSONB
+    metrics = Column(JSONB, nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=_UTC_NOW, nullable=False)
 
     # Relationship
     session = relationship("SessionModel", back_populates="content_blocks")
@@ -109,6 +112,7 @@ class ImageAssetModel(Base):
     """Database model for image assets."""
 
     __tablename__ = "image_assets"
+    __table_args__ = (Index("ix_image_assets_session_id", "session_id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     image_id = Column(String(100), unique=True, index=True, nullable=False)
@@ -121,10 +125,10 @@ class ImageAssetModel(Base):
     alt_text = Column(String(500), nullable=False)
     content_role = Column(String(50), default="illustration", nullable=False)
 
-    # Palette stored as JSON array
-    dominant_palette = Column(JSON, nullable=True)
+    # Palette stored as JSONB array
+    dominant_palette = Column(JSONB, nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=_UTC_NOW, nullable=False)
 
     # Relationship
     session = relationship("SessionModel", back_populates="images")
@@ -137,11 +141,12 @@ class IdempotencyKeyModel(Base):
     """Database model for idempotency keys."""
 
     __tablename__ = "idempotency_keys"
+    __table_args__ = (Index("ix_idempotency_keys_expires_at", "expires_at"),)
 
     id = Column(Integer, primary_key=True, index=True)
     idempotency_key = Column(String(255), unique=True, index=True, nullable=False)
     session_id = Column(String(100), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=_UTC_NOW, nullable=False)
     expires_at = Column(DateTime, nullable=True)
 
     def __repr__(self) -> str:
@@ -6,19 +6,64 @@ It validates and normalizes the submission, assembles a Content-Intent Package (
 and coordinates downstream calls to the Gestalt Design Engine.
 """
 
+import asyncio
+import contextlib
+import json
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from services.content_intake.api import sessions
+from services.content_intake.clients.formatter_client import FormatterClient
+from services.content_intake.clients.gestalt_client import GestaltClient
+from services.content_intake.database.connection import SessionLocal
+from services.content_intake.services.session_service import purge_expired_idempotency_keys
 from services.content_intake.ui import routes as ui_routes
+from services.content_intake.utils.body_limit import BodySizeLimitMiddleware
 from services.content_intake.utils.config import settings
 from services.content_intake.utils.logging import setup_logging
 
 # Set up structured logging
 setup_logging()
+logger = logging.getLogger(__name__)
+
+
+async def _purge_idempotency_keys_periodically(interval_seconds: float) -> None:
+    """Delete expired idempotency keys every interval until cancelled."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            async with SessionLocal() as db:
+                deleted = await purge_expired_idempotency_keys(db)
+            if deleted:
+                logger.info("Purged %s expired idempotency keys", deleted)
+        except Exception:
+            logger.error("Idempotency key cleanup failed", exc_info=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create shared clients and background cleanup on startup; tear them down on shutdown."""
+    app.state.gestalt_client = GestaltClient()
+    app.state.formatter_client = FormatterClient()
+    cleanup_task = asyncio.create_task(
+        _purge_idempotency_keys_periodically(settings.IDEMPOTENCY_CLEANUP_INTERVAL_SECONDS)
+    )
+    try:
+        yield
+    finally:
+        cleanup_task.cancel()
+        # Let an in-flight purge unwind before the clients and engine go away
+        with contextlib.suppress(asyncio.CancelledError):
+            await cleanup_task
+        await app.state.gestalt_client.aclose()
+        await app.state.formatter_client.aclose()
+
 
 app = FastAPI(
     title="Content Intake Service",
@@ -26,8 +71,13 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
+# Bound per-request memory: reject oversized intake payloads before they are parsed.
+# Added before CORS so CORS wraps it and 413s still carry CORS headers.
+app.add_middleware(BodySizeLimitMiddleware, max_body_bytes=settings.MAX_REQUEST_BODY_BYTES)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -46,13 +96,18 @@ app.include_router(sessions.router, prefix="/v1/intake", tags=["sessions"])
 app.include_router(ui_routes.router, tags=["ui"])
 
 
+# Static probe bodies, encoded once instead of serialized on every hit
+_HEALTH_BODY = json.dumps({"status": "healthy", "service": "content-intake"}).encode()
+_ROOT_BODY = json.dumps({"service": "Content Intake Service", "version": "1.0.0"}).encode()
+
+
 @app.get("/health")
-async def health_check() -> dict[str, str]:
+async def health_check() -> Response:
     """Health check endpoint."""
-    return {"status": "healthy", "service": "content-intake"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/")
-async def root() -> dict[str, str]:
+async def root() -> Response:
     """Root endpoint."""
-    return {"service": "Content Intake Service", "version": "1.0.0"}
+    return Response(content=_ROOT_BODY, media_type="application/json")
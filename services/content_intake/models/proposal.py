@@ -0,0 +1,17 @@
+"""
+Data models for Gestalt Design Engine responses.
+
+Typed views of the proposal responses the Content Intake Service consumes,
+decoded directly from the response body.
+"""
+
+from pydantic import BaseModel
+
+
+class ProposalResponse(BaseModel):
+    """Proposal creation or status response from the Gestalt Engine."""
+
+    proposal_id: str
+    status: str
+    estimated_completion_seconds: int | None = None
+    error: str | None = None
@@ -7,7 +7,7 @@ including session metadata, content blocks, images, and intent descriptors.
 
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Literal
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
@@ -39,35 +39,35 @@ class ContentBlockType(str, Enum):
 class ContentBlock(BaseModel):
     """Represents a single content block."""
 
-    block_id: str = Field(default_factory=lambda: f"block-{uuid4().hex[:8]}")
+    block_id: str = Field(default_factory=lambda: f"block-{uuid4().hex[:8]}", max_length=100)
     type: ContentBlockType
     level: int = Field(default=0, ge=0, le=6)
     sequence: int = Field(ge=0)
     text: str = Field(max_length=10000)
     language: str = Field(default="en", pattern=r"^[a-z]{2}$")
-    detected_role: str | None = None
+    detected_role: str | None = Field(default=None, max_length=50)
     metrics: dict[str, Any] = Field(default_factory=dict)
 
 
 class ImageAsset(BaseModel):
     """Represents an image asset."""
 
-    image_id: str = Field(default_factory=lambda: f"img-{uuid4().hex[:8]}")
-    uri: str
-    format: str = Field(pattern=r"^(png|jpg|jpeg|svg)$")
+    image_id: str = Field(default_factory=lambda: f"img-{uuid4().hex[:8]}", max_length=100)
+    uri: str = Field(max_length=500)
+    format: Literal["png", "jpg", "jpeg", "svg"]
     width_px: int = Field(gt=0, le=4096)
     height_px: int = Field(gt=0, le=4096)
     alt_text: str = Field(max_length=500)
-    content_role: str = Field(default="illustration")
+    content_role: str = Field(default="illustration", max_length=50)
     dominant_palette: list[str] = Field(default_factory=list)
 
 
 class DesignIntent(BaseModel):
     """Design intent metadata."""
 
-    purpose: str = Field(pattern=r"^(report|presentation|proposal|playbook)$")
-    audience: str = Field(pattern=r"^(executive|technical|customer|internal)$")
-    tone: str = Field(default="formal", pattern=r"^(formal|conversational|persuasive|educational)$")
+    purpose: Literal["report", "presentation", "proposal", "playbook"]
+    audience: Literal["executive", "technical", "customer", "internal"]
+    tone: Literal["formal", "conversational", "persuasive", "educational"] = "formal"
     goals: list[str] = Field(default_factory=lambda: ["clarity"])
     primary_actions: list[str] = Field(default_factory=list)
     success_metrics: list[str] = Field(default_factory=list)
@@ -76,9 +76,7 @@ class DesignIntent(BaseModel):
 class Constraints(BaseModel):
     """Design constraints and preferences."""
 
-    visual_density: str = Field(
-        default="balanced", pattern=r"^(tight|balanced|airy)$"
-    )
+    visual_density: Literal["tight", "balanced", "airy"] = "balanced"
     color_policy: dict[str, Any] = Field(default_factory=dict)
     brand_guidelines: dict[str, Any] = Field(default_factory=dict)
     document_preferences: dict[str, Any] = Field(default_factory=dict)
@@ -97,7 +95,7 @@ class CreateSessionRequest(BaseModel):
 class SubmitSessionRequest(BaseModel):
     """Request to submit a session for layout generation."""
 
-    layout_mode: str = Field(default="rule_only", pattern=r"^(rule_only|ai_assist|ai_full)$")
+    layout_mode: Literal["rule_only", "ai_assist", "ai_full"] = "rule_only"
 
 
 class Session(BaseModel):
@@ -7,12 +7,15 @@ Coordinates calls to downstream services like the Gestalt Design Engine.
 
 from typing import Any
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
+import orjson
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 import logging
+from uuid import uuid4
 
 from services.content_intake.models.session import (
     CreateSessionRequest,
-    Session as SessionResponse,
+    SessionResponse,
     SessionStatus,
 )
 from services.content_intake.database.models import (
@@ -24,23 +27,160 @@ from services.content_intake.database.models import (
 )
 from services.content_intake.clients.gestalt_client import GestaltClient
 from services.content_intake.clients.formatter_client import FormatterClient
+from services.content_intake.utils.cache import TTLCache
+from services.content_intake.utils.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Idempotency keys stay valid for this long after the session is created
+IDEMPOTENCY_KEY_TTL = timedelta(hours=24)
+
+# Process-wide fast path for duplicate create requests (idempotency key ->
+# session_id). The idempotency_keys table stays the source of truth; a miss
+# here always falls back to it.
+_idempotency_cache: TTLCache[str, str] = TTLCache(
+    maxsize=100_000, ttl=IDEMPOTENCY_KEY_TTL.total_seconds()
+)
+
+# Sessions can only be submitted for layout from these states
+_SUBMITTABLE_STATUSES = frozenset({SessionStatusEnum.DRAFT.value, SessionStatusEnum.READY.value})
+
+# Hot-path statements are built once at import and executed with a bound
+# session_id/idempotency_key, so each call reuses the cached compiled SQL
+# without rebuilding the statement
+_IDEMPOTENCY_KEY_STMT = select(
+    IdempotencyKeyModel.session_id, IdempotencyKeyModel.expires_at
+).where(IdempotencyKeyModel.idempotency_key == bindparam("idempotency_key"))
+
+_SESSION_STMT = select(SessionModel).where(SessionModel.session_id == bindparam("session_id"))
+
+_ARTIFACT_SOURCE_STMT = select(SessionModel.proposal_id, SessionModel.status).where(
+    SessionModel.session_id == bindparam("session_id")
+)
+
+_CIP_BLOCKS_STMT = (
+    select(
+        ContentBlockModel.block_id,
+        ContentBlockModel.type,
+        ContentBlockModel.level,
+        ContentBlockModel.sequence,
+        ContentBlockModel.text,
+        ContentBlockModel.language,
+        ContentBlockModel.detected_role,
+        ContentBlockModel.metrics,
+    )
+    .where(ContentBlockModel.session_id == bindparam("session_id"))
+    .order_by(ContentBlockModel.sequence)
+)
+
+_CIP_IMAGES_STMT = select(
+    ImageAssetModel.image_id,
+    ImageAssetModel.uri,
+    ImageAssetModel.format,
+    ImageAssetModel.width_px,
+    ImageAssetModel.height_px,
+    ImageAssetModel.alt_text,
+    ImageAssetModel.content_role,
+    ImageAssetModel.dominant_palette,
+).where(ImageAssetModel.session_id == bindparam("session_id"))
+
+
+def _normalize_block_rows(block_rows: list[dict[str, Any]]) -> None:
+    """
+    Normalize pending content block rows in place.
+
+    Adds word count and reading-time metrics and fills in a detected role
+    where the client did not supply one.
+
+    Args:
+        block_rows: Content block rows about to be inserted
+    """
+    for block in block_rows:
+        # Calculate word count
+        word_count = len(block["text"].split())
+
+        # Estimate reading time (200 words per minute average). Integer
+        # arithmetic is exact where (word_count / 200) * 60 can round down.
+        block["metrics"] = {
+            **(block["metrics"] or {}),
+            "word_count": word_count,
+            "estimated_reading_seconds": word_count * 60 // 200,
+        }
+
+        # Auto-detect role based on type and position. Rows carry the plain
+        # type string (resolved from the enum once, when the row was built)
+        if not block["detected_role"]:
+            block_type = block["type"]
+            if block_type == "heading" and block["sequence"] == 0:
+                block["detected_role"] = "introduction"
+            elif block_type == "callout":
+                block["detected_role"] = "action"
+            else:
+                block["detected_role"] = "supporting"
+
+
+async def purge_expired_idempotency_keys(db: AsyncSession, batch_size: int = 5000) -> int:
+    """
+    Delete expired idempotency keys.
+
+    Deletes in batches, committing each one, so row locks are held only
+    briefly and a large backlog never becomes one long transaction.
+
+    Args:
+        db: SQLAlchemy async database session
+        batch_size: Maximum rows deleted per transaction
+
+    Returns:
+        Number of keys deleted
+    """
+    total = 0
+    while True:
+        expired_ids = (
+            select(IdempotencyKeyModel.id)
+            .where(IdempotencyKeyModel.expires_at < datetime.utcnow())
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        result = await db.execute(
+            delete(IdempotencyKeyModel).where(IdempotencyKeyModel.id.in_(expired_ids))
+        )
+        await db.commit()
+        total += result.rowcount
+        if result.rowcount < batch_size:
+            return total
+
+
+class SessionNotFoundError(ValueError):
+    """Raised when the requested session does not exist."""
+
+
+class SessionStateError(ValueError):
+    """Raised when the session's status does not allow the requested operation."""
+
 
 class SessionService:
     """Service for managing intake sessions with PostgreSQL backend."""
 
-    def __init__(self, db: Session) -> None:
+    def __init__(
+        self,
+        db: AsyncSession,
+        gestalt_client: GestaltClient,
+        formatter_client: FormatterClient,
+    ) -> None:
         """
         Initialize session service with database session.
 
         Args:
-            db: SQLAlchemy database session
+            db: SQLAlchemy async database session
+            gestalt_client: Shared Gestalt Engine client, owned and closed by the app lifespan
+            formatter_client: Shared Document Formatter client, owned and closed by the app lifespan
         """
         self.db = db
-        self.gestalt_client = GestaltClient()
-        self.formatter_client = FormatterClient()
+        # Sessions already loaded by this service instance (one per request),
+        # so validate-then-act flows do not re-query the same session
+        self._loaded_sessions: dict[str, SessionModel] = {}
+        self.gestalt_client = gestalt_client
+        self.formatter_client = formatter_client
 
     async def create_session(
         self, request: CreateSessionRequest, idempotency_key: str | None = None
@@ -52,14 +192,28 @@ class SessionService:
         """
         # Check idempotency
         if idempotency_key:
-            existing = self.db.query(IdempotencyKeyModel).filter(
-                IdempotencyKeyModel.idempotency_key == idempotency_key
-            ).first()
-            if existing:
-                session_model = self.db.query(SessionModel).filter(
-                    SessionModel.session_id == existing.session_id
+            existing_session_id = _idempotency_cache.get(idempotency_key)
+            if existing_session_id is None:
+                existing = (
+                    await self.db.execute(
+                        _IDEMPOTENCY_KEY_STMT, {"idempotency_key": idempotency_key}
+                    )
                 ).first()
-                return self._model_to_response(session_model)
+                if existing:
+                    existing_session_id, expires_at = existing
+                    if expires_at is not None and expires_at <= datetime.utcnow():
+                        # Expired but not yet purged: free the key for this request
+                        await self.db.execute(
+                            delete(IdempotencyKeyModel).where(
+                                IdempotencyKeyModel.idempotency_key == idempotency_key
+                            )
+                        )
+                        existing_session_id = None
+                    else:
+                        self._cache_idempotency_key(idempotency_key, existing_session_id, expires_at)
+            if existing_session_id:
+                session_model = await self._load_session(existing_session_id)
+                return self._model_to_summary(session_model)
 
         # Validate payload size
         total_blocks = len(request.content_blocks)
@@ -71,80 +225,96 @@ class SessionService:
             raise ValueError(f"Too many images: {total_images} (max 200)")
 
         # Create session model
-        from uuid import uuid4
         session_id = f"sess-{uuid4().hex}"
 
+        block_rows = [
+            {
+                "block_id": block.block_id,
+                "session_id": session_id,
+                "type": block.type.value,
+                "level": block.level,
+                "sequence": block.sequence,
+                "text": block.text,
+                "language": block.language,
+                "detected_role": block.detected_role,
+                "metrics": block.metrics,
+            }
+            for block in request.content_blocks
+        ]
+
+        image_rows = [
+            {
+                "image_id": image.image_id,
+                "session_id": session_id,
+                "uri": image.uri,
+                "format": image.format,
+                "width_px": image.width_px,
+                "height_px": image.height_px,
+                "alt_text": image.alt_text,
+                "content_role": image.content_role,
+                "dominant_palette": image.dominant_palette,
+            }
+            for image in request.images
+        ]
+
+        # Normalize content before anything is written, so the session row is
+        # inserted already READY and each block row is inserted once
+        _normalize_block_rows(block_rows)
+
         session_model = SessionModel(
             session_id=session_id,
-            status=SessionStatusEnum.DRAFT.value,  # Use enum value directly for PostgreSQL
+            status=SessionStatusEnum.READY.value,
             design_intent=request.design_intent.model_dump(),
             constraints=request.constraints.model_dump() if request.constraints else {},
+            block_count=total_blocks,
+            image_count=total_images,
+            # Set explicitly so the summary can be built without a reload
+            proposal_id=None,
+            error_message=None,
         )
 
-        self.db.add(session_model)
-        self.db.flush()  # Get session_id before creating related records
-
-        # Create content blocks
-        for block in request.content_blocks:
-            block_model = ContentBlockModel(
-                block_id=block.block_id,
-                session_id=session_id,
-                type=block.type.value,
-                level=block.level,
-                sequence=block.sequence,
-                text=block.text,
-                language=block.language,
-                detected_role=block.detected_role,
-                metrics=block.metrics,
-            )
-            self.db.add(block_model)
-
-        # Create image assets
-        for image in request.images:
-            image_model = ImageAssetModel(
-                image_id=image.image_id,
-                session_id=session_id,
-                uri=image.uri,
-                format=image.format,
-                width_px=image.width_px,
-                height_px=image.height_px,
-                alt_text=image.alt_text,
-                content_role=image.content_role,
-                dominant_palette=image.dominant_palette,
-            )
-            self.db.add(image_model)
-
         try:
-            # Normalize content
-            await self._normalize_content(session_model)
+            self.db.add(session_model)
+            await self.db.flush()  # Insert parent row first so child foreign keys resolve
+
+            # One executemany round-trip per child table instead of one INSERT per row;
+            # very large payloads go through COPY, which skips per-row parse/plan
+            if len(block_rows) > settings.BULK_COPY_THRESHOLD and self._supports_copy():
+                await self._copy_content_blocks(block_rows)
+            else:
+                await self.db.execute(insert(ContentBlockModel), block_rows)
+            if image_rows:
+                await self.db.execute(insert(ImageAssetModel), image_rows)
 
             # Store idempotency key
             if idempotency_key:
                 idem_key = IdempotencyKeyModel(
                     idempotency_key=idempotency_key,
                     session_id=session_id,
-                    expires_at=datetime.utcnow() + timedelta(hours=24),
+                    expires_at=datetime.utcnow() + IDEMPOTENCY_KEY_TTL,
                 )
                 self.db.add(idem_key)
 
-            self.db.commit()
-            self.db.refresh(session_model)
+            await self.db.commit()
+            if idempotency_key:
+                self._cache_idempotency_key(idempotency_key, session_id, idem_key.expires_at)
 
-            return self._model_to_response(session_model)
+            # Server-generated timestamps came back with the INSERT (eager_defaults)
+            return self._model_to_summary(session_model)
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
+            # Rollback expires every loaded instance
+            self._loaded_sessions.clear()
             raise
 
     async def get_session(self, session_id: str) -> SessionResponse | None:
-        """Retrieve session by ID."""
-        session_model = self.db.query(SessionModel).filter(
-            SessionModel.session_id == session_id
-        ).first()
+        """Retrieve session metadata by ID without loading its content."""
+        session_model = await self._load_session(session_id)
 
         if not session_model:
             return None
 
-        return self._model_to_response(session_model)
+        return self._model_to_summary(session_model)
 
     async def submit_session(
         self, session_id: str, layout_mode: str, idempotency_key: str | None = None
@@ -155,49 +325,33 @@ class SessionService:
         Transitions session to layout_queued and triggers downstream processing
         by calling the Gestalt Design Engine.
         """
-        session_model = self.db.query(SessionModel).filter(
-            SessionModel.session_id == session_id
-        ).first()
+        session_model = await self._load_session(session_id)
 
         if not session_model:
-            raise ValueError("Session not found")
-
-        if session_model.status not in [SessionStatusEnum.DRAFT.value, SessionStatusEnum.READY.value]:
-            raise ValueError(f"Cannot submit session in status {session_model.status}")
-
-        # Build Content-Intent Package (CIP) for Gestalt Engine
-        content_blocks = [
-            {
-                "block_id": block.block_id,
-                "type": block.type,
-                "level": block.level,
-                "sequence": block.sequence,
-                "text": block.text,
-                "language": block.language,
-                "detected_role": block.detected_role,
-                "metrics": block.metrics or {},
-            }
-            for block in session_model.content_blocks
-        ]
-
-        images = [
-            {
-                "image_id": image.image_id,
-                "uri": image.uri,
-                "format": image.format,
-                "width_px": image.width_px,
-                "height_px": image.height_px,
-                "alt_text": image.alt_text,
-                "content_role": image.content_role,
-                "dominant_palette": image.dominant_palette or [],
-            }
-            for image in session_model.images
-        ]
+            raise SessionNotFoundError("Session not found")
+
+        if session_model.status not in _SUBMITTABLE_STATUSES:
+            raise SessionStateError(f"Cannot submit session in status {session_model.status}")
+
+        # Build Content-Intent Package (CIP) for Gestalt Engine from just the
+        # columns it needs, read as plain row tuples rather than ORM objects.
+        # The stored counts let empty child tables be skipped without a query.
+        block_rows = []
+        if session_model.block_count:
+            block_rows = (
+                await self.db.execute(_CIP_BLOCKS_STMT, {"session_id": session_id})
+            ).all()
+
+        image_rows = []
+        if session_model.image_count:
+            image_rows = (
+                await self.db.execute(_CIP_IMAGES_STMT, {"session_id": session_id})
+            ).all()
 
         cip = self.gestalt_client.build_cip(
             session_id=session_id,
-            content_blocks=content_blocks,
-            images=images,
+            content_blocks=block_rows,
+            images=image_rows,
             design_intent=session_model.design_intent,
             constraints=session_model.constraints or {},
         )
@@ -208,27 +362,43 @@ class SessionService:
                 cip=cip,
                 idempotency_key=idempotency_key,
             )
-
-            # Update session with proposal ID from Gestalt
-            session_model.status = SessionStatusEnum.LAYOUT_QUEUED.value
-            session_model.proposal_id = proposal_response["proposal_id"]
-            session_model.updated_at = datetime.utcnow()
-
-            self.db.commit()
-            self.db.refresh(session_model)
-
-            return self._model_to_response(session_model)
-
         except ValueError as e:
             # Update session to failed state
             session_model.status = SessionStatusEnum.FAILED.value
             session_model.error_message = str(e)
             session_model.updated_at = datetime.utcnow()
-            self.db.commit()
-            self.db.refresh(session_model)
+            await self.db.commit()
 
             raise ValueError(f"Failed to submit to Gestalt Engine: {e}")
 
+        # Record the proposal with one guarded UPDATE: the status check and the
+        # transition are atomic, so a concurrent submit or delete cannot slip
+        # in between. The ORM applies the new values to session_model in memory.
+        queued = (
+            await self.db.execute(
+                update(SessionModel)
+                .where(
+                    SessionModel.session_id == session_id,
+                    SessionModel.status.in_(_SUBMITTABLE_STATUSES),
+                )
+                .values(
+                    status=SessionStatusEnum.LAYOUT_QUEUED.value,
+                    proposal_id=proposal_response.proposal_id,
+                    updated_at=datetime.utcnow(),
+                )
+                .returning(SessionModel.id)
+            )
+        ).first()
+
+        if queued is None:
+            await self.db.rollback()
+            self._loaded_sessions.pop(session_id, None)
+            raise SessionStateError("Session status changed while it was being submitted")
+
+        await self.db.commit()
+
+        return self._model_to_summary(session_model)
+
     async def check_proposal_status(self, session_id: str) -> SessionResponse:
         """
         Check proposal status from Gestalt Engine and update session.
@@ -236,15 +406,13 @@ class SessionService:
         Polls the Gestalt Engine for the current status of the layout proposal
         and updates the session status accordingly.
         """
-        session_model = self.db.query(SessionModel).filter(
-            SessionModel.session_id == session_id
-        ).first()
+        session_model = await self._load_session(session_id)
 
         if not session_model:
-            raise ValueError("Session not found")
+            raise SessionNotFoundError("Session not found")
 
         if not session_model.proposal_id:
-            raise ValueError("Session has no proposal ID (not submitted)")
+            raise SessionStateError("Session has no proposal ID (not submitted)")
 
         try:
             # Poll Gestalt Engine for proposal status
@@ -253,7 +421,7 @@ class SessionService:
             )
 
             # Update session based on Gestalt status
-            gestalt_status = proposal_status["status"]
+            gestalt_status = proposal_status.status
 
             if gestalt_status == "processing":
                 session_model.status = SessionStatusEnum.LAYOUT_PROCESSING.value
@@ -261,171 +429,177 @@ class SessionService:
                 session_model.status = SessionStatusEnum.LAYOUT_COMPLETE.value
             elif gestalt_status == "failed":
                 session_model.status = SessionStatusEnum.FAILED.value
-                session_model.error_message = proposal_status.get("error", "Layout generation failed")
+                session_model.error_message = proposal_status.error or "Layout generation failed"
 
             session_model.updated_at = datetime.utcnow()
-            self.db.commit()
-            self.db.refresh(session_model)
+            await self.db.commit()
 
-            return self._model_to_response(session_model)
+            return self._model_to_summary(session_model)
 
         except ValueError as e:
             # If proposal not found in Gestalt, mark as failed
             session_model.status = SessionStatusEnum.FAILED.value
             session_model.error_message = str(e)
             session_model.updated_at = datetime.utcnow()
-            self.db.commit()
-            self.db.refresh(session_model)
+            await self.db.commit()
 
             raise
 
-    async def get_artifacts(self, session_id: str) -> list[dict[str, Any]]:
-        """Get artifacts for a session."""
-        session_model = self.db.query(SessionModel).filter(
-            SessionModel.session_id == session_id
+    async def get_artifacts(self, session_id: str) -> list[dict[str, Any]] | None:
+        """
+        Get artifacts for a session.
+
+        Reads only the columns artifacts are derived from, so the existence
+        check and the artifact listing share one query.
+
+        Returns:
+            Artifact descriptors, or None if the session does not exist
+        """
+        row = (
+            await self.db.execute(_ARTIFACT_SOURCE_STMT, {"session_id": session_id})
         ).first()
 
-        if not session_model:
-            return []
+        if row is None:
+            return None
 
+        proposal_id, session_status = row
         artifacts: list[dict[str, Any]] = []
 
         # Return layout specification if available
-        if session_model.proposal_id:
+        if proposal_id:
             artifacts.append(
                 {
-                    "artifact_id": session_model.proposal_id,
+                    "artifact_id": proposal_id,
                     "type": "layout_specification",
-                    "status": "complete" if session_model.status == SessionStatusEnum.LAYOUT_COMPLETE.value else "pending",
+                    "status": "complete" if session_status == SessionStatusEnum.LAYOUT_COMPLETE.value else "pending",
                 }
             )
 
         return artifacts
 
     async def delete_session(self, session_id: str) -> None:
-        """Delete a session and all related data (cascading)."""
-        session_model = self.db.query(SessionModel).filter(
-            SessionModel.session_id == session_id
+        """
+        Delete a session and all related data.
+
+        The status guard is part of each DELETE, so the success path needs no
+        preliminary SELECT; the session is only looked up again to tell a
+        missing session from a rendered one when nothing was deleted.
+        """
+        self._loaded_sessions.pop(session_id, None)
+        deletable = (SessionModel.session_id == session_id) & (
+            SessionModel.status != SessionStatusEnum.LAYOUT_COMPLETE.value
+        )
+        deletable_id = select(SessionModel.session_id).where(deletable).scalar_subquery()
+
+        await self.db.execute(
+            delete(ContentBlockModel).where(ContentBlockModel.session_id == deletable_id)
+        )
+        await self.db.execute(
+            delete(ImageAssetModel).where(ImageAssetModel.session_id == deletable_id)
+        )
+        deleted = (
+            await self.db.execute(delete(SessionModel).where(deletable).returning(SessionModel.id))
         ).first()
 
-        if not session_model:
-            raise ValueError("Session not found")
+        if deleted is None:
+            await self.db.rollback()
+            exists = (
+                await self.db.execute(
+                    select(SessionModel.id).where(SessionModel.session_id == session_id)
+                )
+            ).first()
+            if exists is None:
+                raise SessionNotFoundError("Session not found")
+            raise SessionStateError("Cannot delete session that has been rendered")
+
+        await self.db.commit()
+
+    def _cache_idempotency_key(
+        self, idempotency_key: str, session_id: str, expires_at: datetime | None
+    ) -> None:
+        """Remember a committed idempotency key for the rest of its lifetime."""
+        ttl = None
+        if expires_at is not None:
+            ttl = (expires_at - datetime.utcnow()).total_seconds()
+            if ttl <= 0:
+                return
+        _idempotency_cache.set(idempotency_key, session_id, ttl=ttl)
+
+    async def _load_session(self, session_id: str) -> SessionModel | None:
+        """
+        Load a session's metadata.
 
-        if session_model.status == SessionStatusEnum.LAYOUT_COMPLETE.value:
-            raise ValueError("Cannot delete session that has been rendered")
+        A session is queried at most once per service instance; later calls
+        return the same (strongly referenced) object. populate_existing
+        replaces any stale identity-map state on that first query.
 
-        self.db.delete(session_model)
-        self.db.commit()
+        Args:
+            session_id: Session identifier
 
-    async def _normalize_content(self, session_model: SessionModel) -> None:
+        Returns:
+            Session model, or None if the session does not exist
         """
-        Normalize content blocks.
+        session_model = self._loaded_sessions.get(session_id)
+        if session_model is not None:
+            return session_model
+
+        result = await self.db.execute(
+            _SESSION_STMT,
+            {"session_id": session_id},
+            execution_options={"populate_existing": True},
+        )
+        session_model = result.scalar_one_or_none()
+        if session_model is not None:
+            self._loaded_sessions[session_id] = session_model
+        return session_model
 
-        Performs tokenization, structural detection, and enrichment.
+    def _supports_copy(self) -> bool:
+        """Check whether the bound driver exposes asyncpg's COPY API."""
+        return self.db.get_bind().dialect.driver == "asyncpg"
+
+    async def _copy_content_blocks(self, block_rows: list[dict[str, Any]]) -> None:
         """
-        # Refresh to get content blocks
-        self.db.refresh(session_model)
-
-        # Detect structural cues and enrich metadata
-        for block in session_model.content_blocks:
-            # Calculate word count
-            word_count = len(block.text.split())
-            if not block.metrics:
-                block.metrics = {}
-            block.metrics["word_count"] = word_count
-
-            # Estimate reading time (200 words per minute average)
-            block.metrics["estimated_reading_seconds"] = int((word_count / 200) * 60)
-
-            # Auto-detect role based on type and position
-            if not block.detected_role:
-                if block.type == "heading" and block.sequence == 0:
-                    block.detected_role = "introduction"
-                elif block.type == "callout":
-                    block.detected_role = "action"
-                else:
-                    block.detected_role = "supporting"
-
-        # Update session status
-        session_model.status = SessionStatusEnum.READY.value
-        session_model.updated_at = datetime.utcnow()
-
-    def _model_to_response(self, session_model: SessionModel) -> SessionResponse:
-        """Convert database model to response model."""
-        from services.content_intake.models.session import ContentBlock, ImageAsset, DesignIntent, Constraints
-
-        # Convert content blocks
-        content_blocks = []
-        for block_model in session_model.content_blocks:
-            content_blocks.append(
-                ContentBlock(
-                    block_id=block_model.block_id,
-                    type=block_model.type,
-                    level=block_model.level,
-                    sequence=block_model.sequence,
-                    text=block_model.text,
-                    language=block_model.language,
-                    detected_role=block_model.detected_role,
-                    metrics=block_model.metrics or {},
-                )
-            )
+        Ingest content blocks with PostgreSQL COPY.
 
-        # Convert images
-        images = []
-        for image_model in session_model.images:
-            images.append(
-                ImageAsset(
-                    image_id=image_model.image_id,
-                    uri=image_model.uri,
-                    format=image_model.format,
-                    width_px=image_model.width_px,
-                    height_px=image_model.height_px,
-                    alt_text=image_model.alt_text,
-                    content_role=image_model.content_role,
-                    dominant_palette=image_model.dominant_palette or [],
-                )
+        Runs on the session's own connection so the rows share the
+        create_session transaction and roll back with it. created_at is left
+        out so the column's server default fills it.
+
+        Args:
+            block_rows: Normalized content block rows
+        """
+        columns = (
+            "block_id", "session_id", "type", "level", "sequence",
+            "text", "language", "detected_role", "metrics",
+        )
+        records = [
+            (
+                block["block_id"],
+                block["session_id"],
+                block["type"],
+                block["level"],
+                block["sequence"],
+                block["text"],
+                block["language"],
+                block["detected_role"],
+                orjson.dumps(block["metrics"]).decode(),
             )
+            for block in block_rows
+        ]
 
-        # Convert database status value to response enum
-        # session_model.status should now always be a string from TypeDecorator
-        # But handle both cases for safety
-        status_value = None
-        if isinstance(session_model.status, SessionStatusEnum):
-            # Extract the actual value from the enum
-            status_value = session_model.status.value
-        elif isinstance(session_model.status, str):
-            # Already a string, use as-is
-            status_value = session_model.status
-        else:
-            # Try to get value attribute if it exists
-            if hasattr(session_model.status, 'value'):
-                status_value = session_model.status.value
-            else:
-                status_value = str(session_model.status)
-        
-        # Debug logging
-        logger.debug(f"Converting status for session {session_model.session_id}: "
-                    f"raw={session_model.status}, type={type(session_model.status)}, "
-                    f"value={status_value}")
-        
-        # Validate and convert to Pydantic enum
-        try:
-            response_status = SessionStatus(status_value)
-        except ValueError as e:
-            logger.error(f"Invalid status value '{status_value}' (raw: {session_model.status}, type: {type(session_model.status)}) "
-                        f"for session {session_model.session_id}: {e}")
-            # Fallback to DRAFT if invalid
-            response_status = SessionStatus.DRAFT
-        
-        return SessionResponse(
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            "content_blocks", records=records, columns=columns
+        )
+
+    def _model_to_summary(self, session_model: SessionModel) -> SessionResponse:
+        """Convert database model to the session metadata response, without content."""
+        return SessionResponse.model_construct(
             session_id=session_model.session_id,
-            status=response_status,
+            # The sessions_status_check constraint guarantees a known status value
+            status=SessionStatus(session_model.status),
             created_at=session_model.created_at,
-            created_by=session_model.created_by,
-            content_blocks=content_blocks,
-            images=images,
-            design_intent=DesignIntent(**session_model.design_intent),
-            constraints=Constraints(**session_model.constraints) if session_model.constraints else Constraints(),
             proposal_id=session_model.proposal_id,
             error_message=session_model.error_message,
         )
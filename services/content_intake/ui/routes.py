@@ -10,30 +10,35 @@ router = APIRouter()
 # Set up templates
 templates_dir = Path(__file__).parent / "templates"
 templates = Jinja2Templates(directory=str(templates_dir))
+# Templates ship with the service; skip the per-render stat() for changes
+templates.env.auto_reload = False
+
+# These pages take no per-request context, so they are rendered once at import
+_INDEX_HTML = templates.get_template("index.html").render()
+_NEW_SESSION_HTML = templates.get_template("new_session.html").render()
+_DASHBOARD_HTML = templates.get_template("dashboard.html").render()
+_SESSION_DETAIL_TEMPLATE = templates.get_template("session_detail.html")
 
 
 @router.get("/", response_class=HTMLResponse)
 async def home(request: Request) -> HTMLResponse:
     """Render home page."""
-    return templates.TemplateResponse("index.html", {"request": request})
+    return HTMLResponse(_INDEX_HTML)
 
 
 @router.get("/sessions/new", response_class=HTMLResponse)
 async def new_session(request: Request) -> HTMLResponse:
     """Render new session form."""
-    return templates.TemplateResponse("new_session.html", {"request": request})
+    return HTMLResponse(_NEW_SESSION_HTML)
 
 
 @router.get("/sessions/{session_id}", response_class=HTMLResponse)
 async def view_session(request: Request, session_id: str) -> HTMLResponse:
     """Render session detail page."""
-    return templates.TemplateResponse(
-        "session_detail.html",
-        {"request": request, "session_id": session_id}
-    )
+    return HTMLResponse(_SESSION_DETAIL_TEMPLATE.render(request=request, session_id=session_id))
 
 
 @router.get("/dashboard", response_class=HTMLResponse)
 async def dashboard(request: Request) -> HTMLResponse:
     """Render dashboard."""
-    return templates.TemplateResponse("dashboard.html", {"request": request})
+    return HTMLResponse(_DASHBOARD_HTML)
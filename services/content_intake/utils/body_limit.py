@@ -0,0 +1,84 @@
+"""
+Request body size limiting.
+
+FastAPI reads and parses a whole JSON body before the request model's
+length limits are checked, so payload caps alone do not bound memory.
+This middleware rejects oversized bodies while they are still arriving.
+"""
+
+from starlette import status
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class BodySizeLimitMiddleware:
+    """ASGI middleware that rejects request bodies larger than a fixed size."""
+
+    def __init__(self, app: ASGIApp, max_body_bytes: int) -> None:
+        """
+        Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            max_body_bytes: Largest accepted request body in bytes
+        """
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Reject by Content-Length up front, and count streamed chunks otherwise."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length is not None and content_length.isdigit():
+            if int(content_length) > self.max_body_bytes:
+                await self._reject(scope, receive, send)
+                return
+
+        received = 0
+        exceeded = False
+        response_started = False
+
+        async def limited_receive() -> Message:
+            # Chunked uploads carry no Content-Length; stop reading once the
+            # running total passes the limit. The app sees a disconnect, so it
+            # stops parsing whatever its error handling does with it.
+            nonlocal received, exceeded
+            if exceeded:
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    exceeded = True
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            # Once the body is cut off, the app's own response (an error about
+            # the truncated body) is dropped in favour of the 413 below
+            nonlocal response_started
+            if exceeded:
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            if not exceeded:
+                raise
+        if exceeded and not response_started:
+            await self._reject(scope, receive, send)
+
+    async def _reject(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Send the 413 response."""
+        response = JSONResponse(
+            {"detail": f"Request body exceeds {self.max_body_bytes} bytes"},
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        )
+        await response(scope, receive, send)
@@ -1,28 +1,131 @@
 """API endpoints for artifact management."""
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
+import os
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 from fastapi.responses import FileResponse
 
 from services.document_formatter.models.job import ArtifactResponse, FileType
+from services.document_formatter.utils.paths import artifacts_dir, project_root
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 # Artifact storage directory (absolute path from project root)
-# Calculate from this file: services/document_formatter/api/artifacts.py
-# Go up 4 levels to get to project root
-_project_root = Path(__file__).parent.parent.parent.parent.resolve()
-ARTIFACTS_DIR = _project_root / "infrastructure" / "data" / "artifacts"
-ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
+ARTIFACTS_DIR = artifacts_dir()
 
 logger.info(f"Artifacts directory: {ARTIFACTS_DIR} (exists: {ARTIFACTS_DIR.exists()})")
 
 
+# Legacy artifact location, still checked for artifacts rendered before the move
+_OLD_ARTIFACTS_DIR = project_root() / "artifacts"
+
+# Artifact files are never rewritten under the same id, so clients and proxies
+# may keep them
+_ARTIFACT_CACHE_CONTROL = "public, max-age=86400, immutable"
+
+# Download links are valid for a day from when the artifact was rendered
+_ARTIFACT_TTL = timedelta(hours=24)
+
+# Servable file types in lookup precedence order, with their media types
+_MEDIA_TYPES = {
+    FileType.DOCX: "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    FileType.PPTX: "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+}
+
+
+def _index_artifacts() -> dict[str, tuple[Path, FileType]]:
+    """
+    Build an artifact_id -> (path, file type) index from both artifact directories.
+
+    scandir passes at startup replace per-request exists() probes.
+
+    Returns:
+        Index of artifacts currently on disk
+    """
+    index: dict[str, tuple[Path, FileType]] = {}
+    # Lowest-priority location first, so later passes overwrite it and the
+    # result matches _locate_artifact's probe order (DOCX before PPTX, new
+    # directory before old)
+    for file_type in reversed(_MEDIA_TYPES):
+        suffix = f".{file_type.value}"
+        for directory in (_OLD_ARTIFACTS_DIR, ARTIFACTS_DIR):
+            if not directory.is_dir():
+                continue
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(suffix) and entry.is_file():
+                        index[entry.name[: -len(suffix)]] = (Path(entry.path), file_type)
+    return index
+
+
+# Artifacts are immutable once rendered, so the index only ever grows
+_ARTIFACT_INDEX = _index_artifacts()
+logger.info(f"Indexed {len(_ARTIFACT_INDEX)} existing artifacts")
+
+
+def _locate_artifact(artifact_id: str) -> tuple[Path, FileType]:
+    """
+    Find an artifact file on disk.
+
+    Served from the startup index; artifacts rendered since then (by this
+    or another worker) are probed for once and added to it. Misses are not
+    recorded, so an artifact that is still rendering is found later.
+
+    Args:
+        artifact_id: Artifact identifier (file stem)
+
+    Returns:
+        Path to the artifact file and its file type
+
+    Raises:
+        FileNotFoundError: If no artifact file exists in either location
+    """
+    location = _ARTIFACT_INDEX.get(artifact_id)
+    if location is not None:
+        return location
+
+    # Check new location first, then old location
+    for file_type in _MEDIA_TYPES:
+        for directory in (ARTIFACTS_DIR, _OLD_ARTIFACTS_DIR):
+            file_path = directory / f"{artifact_id}.{file_type.value}"
+            if file_path.exists():
+                _ARTIFACT_INDEX[artifact_id] = (file_path, file_type)
+                return file_path, file_type
+    raise FileNotFoundError(artifact_id)
+
+
+async def _stat_artifact(artifact_id: str) -> tuple[Path, FileType, os.stat_result]:
+    """
+    Locate an artifact and stat its file.
+
+    An artifact removed from disk after it was indexed is dropped from the
+    index, so later lookups probe the directories again.
+
+    Args:
+        artifact_id: Artifact identifier (file stem)
+
+    Returns:
+        Path to the artifact file, its file type and its stat result
+
+    Raises:
+        FileNotFoundError: If no artifact file exists
+    """
+    file_path, file_type = _locate_artifact(artifact_id)
+    try:
+        # stat() is a blocking syscall; keep it off the event loop thread
+        file_stat = await asyncio.to_thread(file_path.stat)
+    except FileNotFoundError:
+        _ARTIFACT_INDEX.pop(artifact_id, None)
+        raise
+    return file_path, file_type, file_stat
+
+
 @router.get("/artifacts/{artifact_id}", response_model=ArtifactResponse)
 async def get_artifact(artifact_id: str) -> ArtifactResponse:
     """
@@ -30,35 +133,16 @@ async def get_artifact(artifact_id: str) -> ArtifactResponse:
 
     Returns artifact information including download URL.
     """
-    # Check both locations (new and old for migration)
-    old_artifacts_dir = _project_root / "artifacts"
-    docx_file = ARTIFACTS_DIR / f"{artifact_id}.docx"
-    pptx_file = ARTIFACTS_DIR / f"{artifact_id}.pptx"
-    old_docx_file = old_artifacts_dir / f"{artifact_id}.docx"
-    old_pptx_file = old_artifacts_dir / f"{artifact_id}.pptx"
-    
-    file_path = None
-    file_type = None
-    
-    # Check new location first, then old location
-    if docx_file.exists():
-        file_path = docx_file
-        file_type = FileType.DOCX
-    elif old_docx_file.exists():
-        file_path = old_docx_file
-        file_type = FileType.DOCX
-    elif pptx_file.exists():
-        file_path = pptx_file
-        file_type = FileType.PPTX
-    elif old_pptx_file.exists():
-        file_path = old_pptx_file
-        file_type = FileType.PPTX
-    else:
+    try:
+        _, file_type, file_stat = await _stat_artifact(artifact_id)
+    except FileNotFoundError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Artifact not found")
 
     download_url = f"/v1/artifacts/{artifact_id}/download"
-    expires_at = datetime.utcnow() + timedelta(hours=24)
-    size_bytes = file_path.stat().st_size if file_path else None
+    size_bytes = file_stat.st_size
+    # Anchor expiry to the render time (file mtime) so it does not slide
+    # forward on every metadata request
+    expires_at = datetime.fromtimestamp(file_stat.st_mtime, timezone.utc) + _ARTIFACT_TTL
 
     return ArtifactResponse(
         artifact_id=artifact_id,
@@ -69,57 +153,48 @@ async def get_artifact(artifact_id: str) -> ArtifactResponse:
     )
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header value against an artifact's ETag."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
 @router.get("/artifacts/{artifact_id}/download")
-async def download_artifact(artifact_id: str):
+async def download_artifact(artifact_id: str, request: Request):
     """
     Download generated document file.
 
-    Serves the actual file for download.
+    Serves the actual file for download. Artifacts are immutable, so the
+    artifact_id is a strong ETag and conditional requests get a 304.
     """
-    # Check both locations (new and old for migration)
-    old_artifacts_dir = _project_root / "artifacts"
-    docx_file = ARTIFACTS_DIR / f"{artifact_id}.docx"
-    pptx_file = ARTIFACTS_DIR / f"{artifact_id}.pptx"
-    old_docx_file = old_artifacts_dir / f"{artifact_id}.docx"
-    old_pptx_file = old_artifacts_dir / f"{artifact_id}.pptx"
-    
-    file_path = None
-    media_type = None
-    filename = None
-    
-    # Check new location first, then old location
-    logger.debug(f"Looking for artifact {artifact_id}")
-    logger.debug(f"  Checking: {docx_file} (exists: {docx_file.exists()})")
-    logger.debug(f"  Checking: {pptx_file} (exists: {pptx_file.exists()})")
-    logger.debug(f"  Checking old: {old_docx_file} (exists: {old_docx_file.exists()})")
-    logger.debug(f"  Checking old: {old_pptx_file} (exists: {old_pptx_file.exists()})")
-    
-    if docx_file.exists():
-        file_path = docx_file
-        media_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-        filename = f"{artifact_id}.docx"
-    elif old_docx_file.exists():
-        file_path = old_docx_file
-        media_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-        filename = f"{artifact_id}.docx"
-    elif pptx_file.exists():
-        file_path = pptx_file
-        media_type = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
-        filename = f"{artifact_id}.pptx"
-    elif old_pptx_file.exists():
-        file_path = old_pptx_file
-        media_type = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
-        filename = f"{artifact_id}.pptx"
-    else:
-        logger.error(f"Artifact {artifact_id} not found in {ARTIFACTS_DIR} or {old_artifacts_dir}")
+    etag = f'"{artifact_id}"'
+    try:
+        file_path, file_type, file_stat = await _stat_artifact(artifact_id)
+    except FileNotFoundError:
+        logger.error(f"Artifact {artifact_id} not found in {ARTIFACTS_DIR} or {_OLD_ARTIFACTS_DIR}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Artifact not found. Checked: {ARTIFACTS_DIR} and {old_artifacts_dir}"
+            detail=f"Artifact not found. Checked: {ARTIFACTS_DIR} and {_OLD_ARTIFACTS_DIR}"
         )
 
+    cache_headers = {"ETag": etag, "Cache-Control": _ARTIFACT_CACHE_CONTROL}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    filename = f"{artifact_id}.{file_type.value}"
     return FileResponse(
         path=str(file_path),
-        media_type=media_type,
+        media_type=_MEDIA_TYPES[file_type],
         filename=filename,
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+        # Already stat'ed above; FileResponse would otherwise stat again
+        stat_result=file_stat,
+        headers={
+            **cache_headers,
+            "Content-Disposition": f'attachment; filename="{filename}"',
+        },
     )
@@ -5,8 +5,13 @@ This service transforms Layout Specification Packages (LSP) into Microsoft
 Word and PowerPoint artifacts using python-docx and python-pptx.
 """
 
-from fastapi import FastAPI
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from services.document_formatter.api import rendering, artifacts
 from services.document_formatter.utils.config import settings
@@ -14,12 +19,26 @@ from services.document_formatter.utils.logging import setup_logging
 
 setup_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Start the render worker pool on startup; stop it on shutdown."""
+    await rendering.render_service.start(settings.RENDER_WORKERS)
+    try:
+        yield
+    finally:
+        await rendering.render_service.stop()
+
+
 app = FastAPI(
     title="Document Formatter Service",
     description="Transforms LSP into Word and PowerPoint documents",
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
+    # Render job and artifact responses are encoded with orjson instead of json
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -34,13 +53,18 @@ app.include_router(rendering.router, prefix="/v1/render", tags=["rendering"])
 app.include_router(artifacts.router, prefix="/v1", tags=["artifacts"])
 
 
+# Static probe bodies, encoded once instead of serialized on every hit
+_HEALTH_BODY = json.dumps({"status": "healthy", "service": "document-formatter"}).encode()
+_ROOT_BODY = json.dumps({"service": "Document Formatter Service", "version": "1.0.0"}).encode()
+
+
 @app.get("/health")
-async def health_check() -> dict[str, str]:
+async def health_check() -> Response:
     """Health check endpoint."""
-    return {"status": "healthy", "service": "document-formatter"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/")
-async def root() -> dict[str, str]:
+async def root() -> Response:
     """Root endpoint."""
-    return {"service": "Document Formatter Service", "version": "1.0.0"}
+    return Response(content=_ROOT_BODY, media_type="application/json")
@@ -2,8 +2,8 @@
 
 from datetime import datetime
 from enum import Enum
+from secrets import token_urlsafe
 from typing import Any
-from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
@@ -56,7 +56,7 @@ class ArtifactResponse(BaseModel):
 class RenderJob(BaseModel):
     """Internal render job model."""
 
-    render_job_id: str = Field(default_factory=lambda: f"job-{uuid4().hex[:8]}")
+    render_job_id: str = Field(default_factory=lambda: f"job-{token_urlsafe(6)}")
     status: RenderJobStatus = RenderJobStatus.QUEUED
     layout_specification: dict[str, Any]
     artifact_id: str | None = None
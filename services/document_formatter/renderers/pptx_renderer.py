@@ -1,17 +1,70 @@
 """PowerPoint presentation renderer using python-pptx."""
 
+import io
+from functools import lru_cache
 from typing import Any
-from uuid import uuid4
+from secrets import token_urlsafe
 from pathlib import Path
 import logging
 
+import pptx
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 
+from services.document_formatter.utils.paths import artifacts_dir
+
 logger = logging.getLogger(__name__)
 
+_ALIGNMENTS = {
+    "left": PP_ALIGN.LEFT,
+    "center": PP_ALIGN.CENTER,
+    "right": PP_ALIGN.RIGHT,
+    "justify": PP_ALIGN.JUSTIFY,
+}
+
+# LSP template -> python-pptx default layout index:
+# 0 = Title Slide, 1 = Title and Content, 5 = Title Only, 6 = Blank
+_TITLE_LAYOUT = 0
+_BLANK_LAYOUT = 6
+_LAYOUT_INDEX = {
+    "title_slide": _TITLE_LAYOUT,
+    "bullet_list": 1,
+    "standard_content": 1,
+    "title_only": 5,
+}
+
+# LSP font weights rendered as bold
+_BOLD_WEIGHTS = frozenset({"bold", "semibold"})
+
+
+@lru_cache(maxsize=1)
+def _default_template() -> bytes:
+    """Read python-pptx's bundled default template once per process."""
+    return (Path(pptx.__file__).parent / "templates" / "default.pptx").read_bytes()
+
+
+# Positions, sizes and palette colours repeat across every slide of a deck, so
+# the converted values are memoized; Length and RGBColor are immutable
+@lru_cache(maxsize=512)
+def _inches(value: float) -> Inches:
+    """Convert inches to a python-pptx length."""
+    return Inches(value)
+
+
+@lru_cache(maxsize=128)
+def _pt(value: float) -> Pt:
+    """Convert points to a python-pptx length."""
+    return Pt(value)
+
+
+@lru_cache(maxsize=256)
+def _hex_to_rgb(hex_color: str) -> RGBColor:
+    """Convert a #RRGGBB hex colour to an RGBColor."""
+    # bytes.fromhex parses all three channels in one C call
+    return RGBColor(*bytes.fromhex(hex_color.lstrip("#")[:6]))
+
 
 class PowerPointRenderer:
     """Renders PowerPoint presentations from Layout Specification Packages."""
@@ -24,10 +77,7 @@ class PowerPointRenderer:
             output_dir: Directory to save generated presentations (defaults to infrastructure/data/artifacts)
         """
         if output_dir is None:
-            # Use absolute path relative to project root
-            from pathlib import Path
-            project_root = Path(__file__).parent.parent.parent.parent.resolve()
-            output_dir = project_root / "infrastructure" / "data" / "artifacts"
+            output_dir = artifacts_dir()
         self.output_dir = Path(output_dir).resolve()
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -44,21 +94,31 @@ class PowerPointRenderer:
         # Extract metadata
         metadata = lsp.get("metadata", {})
         structure = lsp.get("structure", [])
+        content_map = lsp.get("content_map", {})
         proposal_id = lsp.get("proposal_id", "unknown")
         session_id = lsp.get("session_id", "unknown")
 
         # Create presentation
-        prs = Presentation()
+        # Same template Presentation() opens, served from memory instead of disk
+        prs = Presentation(io.BytesIO(_default_template()))
 
         # Set presentation dimensions to 16:9
-        prs.slide_width = Inches(10)
-        prs.slide_height = Inches(7.5)
+        prs.slide_width = _inches(10)
+        prs.slide_height = _inches(7.5)
 
         title = metadata.get("title", "Untitled Presentation")
 
-        logger.info(f"Rendering PowerPoint presentation: {title} with {len(structure)} slides")
-        logger.debug(f"Content map has {len(lsp.get('content_map', {}))} entries: {list(lsp.get('content_map', {}).keys())[:5]}")
-        logger.debug(f"First structure unit has {len(structure[0].get('elements', [])) if structure else 0} elements")
+        logger.info("Rendering PowerPoint presentation: %s with %d slides", title, len(structure))
+        # The debug arguments walk the LSP, so skip building them unless enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Content map has %d entries: %s", len(content_map), list(content_map)[:5])
+            logger.debug(
+                "First structure unit has %d elements",
+                len(structure[0].get("elements", [])) if structure else 0,
+            )
+
+        # Slide layouts resolved so far in this presentation, by index
+        layouts: dict[int, Any] = {}
 
         # Iterate through structure units (slides)
         for unit_idx, unit in enumerate(structure):
@@ -68,53 +128,52 @@ class PowerPointRenderer:
             elements = unit.get("elements", [])
 
             # Select slide layout based on template
-            slide_layout = self._select_layout(prs, template, unit_idx == 0)
+            slide_layout = self._select_layout(prs, layouts, template, unit_idx == 0)
 
             # Add slide
             slide = prs.slides.add_slide(slide_layout)
 
             # Render elements on slide
-            await self._render_slide_elements(slide, elements, unit_title, lsp)
+            await self._render_slide_elements(slide, elements, unit_title, content_map)
 
         # Generate artifact ID and save
-        artifact_id = f"artifact-pptx-{uuid4().hex[:8]}"
+        artifact_id = f"artifact-pptx-{token_urlsafe(6)}"
         output_path = self.output_dir / f"{artifact_id}.pptx"
 
         prs.save(str(output_path))
 
-        logger.info(f"PowerPoint presentation saved: {output_path} (artifact_id: {artifact_id})")
+        logger.info("PowerPoint presentation saved: %s (artifact_id: %s)", output_path, artifact_id)
 
         return artifact_id
 
-    def _select_layout(self, prs: Presentation, template: str, is_title: bool):
+    def _select_layout(
+        self, prs: Presentation, layouts: dict[int, Any], template: str, is_title: bool
+    ):
         """
         Select appropriate slide layout.
 
         Args:
             prs: Presentation instance
+            layouts: Per-presentation cache of layouts already looked up
             template: Template name from LSP
             is_title: Whether this is the title slide
 
         Returns:
             Slide layout
         """
-        # python-pptx default layouts:
-        # 0 = Title Slide
-        # 1 = Title and Content
-        # 5 = Title Only
-        # 6 = Blank
-
-        if is_title or template == "title_slide":
-            return prs.slide_layouts[0]  # Title Slide
-        elif template in ["bullet_list", "standard_content"]:
-            return prs.slide_layouts[1]  # Title and Content
-        elif template == "title_only":
-            return prs.slide_layouts[5]  # Title Only
-        else:
-            return prs.slide_layouts[6]  # Blank
+        index = _TITLE_LAYOUT if is_title else _LAYOUT_INDEX.get(template, _BLANK_LAYOUT)
+        layout = layouts.get(index)
+        if layout is None:
+            # slide_layouts[i] resolves the layout part through the master's rels
+            layout = layouts[index] = prs.slide_layouts[index]
+        return layout
 
     async def _render_slide_elements(
-        self, slide, elements: list[dict[str, Any]], slide_title: str | None, lsp: dict[str, Any]
+        self,
+        slide,
+        elements: list[dict[str, Any]],
+        slide_title: str | None,
+        content_map: dict[str, str],
     ) -> None:
         """
         Render elements on a slide.
@@ -123,7 +182,7 @@ class PowerPointRenderer:
             slide: Slide object
             elements: List of layout elements
             slide_title: Optional slide title
-            lsp: Full LSP for content resolution
+            content_map: LSP content map for content resolution
         """
         # Add title if present
         if slide_title and slide.shapes.title:
@@ -139,27 +198,30 @@ class PowerPointRenderer:
             gestalt_rules = element.get("gestalt_rules", {})
 
             # Resolve content
-            content_text = self._resolve_content(content_ref, lsp)
-
-            if not content_text or content_text.startswith("[Missing content"):
-                logger.warning(f"Skipping element with missing content: content_ref={content_ref}, "
-                             f"content_map_keys={list(lsp.get('content_map', {}).keys())[:5]}")
+            content_text = self._resolve_content(content_ref, content_map)
+
+            if not content_text:
+                logger.warning(
+                    "Skipping element with missing content: content_ref=%s, content_map_keys=%s",
+                    content_ref,
+                    list(content_map)[:5],
+                )
                 continue
 
             if element_type == "text":
                 # For long text, split into multiple text boxes or use word wrap
                 # Get position (convert from LSP inches to python-pptx)
-                left = Inches(position.get("x", 1.0))
-                top = Inches(position.get("y", 1.5 + idx * 0.8))
-                width = Inches(position.get("width", 8.5))
+                left = _inches(position.get("x", 1.0))
+                top = _inches(position.get("y", 1.5 + idx * 0.8))
+                width = _inches(position.get("width", 8.5))
                 # Increase height for long text to allow word wrapping
                 base_height = position.get("height", 0.5)
                 if len(content_text) > 200:
                     # Estimate height based on text length (rough: 50 chars per line)
                     estimated_lines = max(1, len(content_text) // 50)
-                    height = Inches(min(base_height * estimated_lines, 5.0))  # Max 5 inches
+                    height = _inches(min(base_height * estimated_lines, 5.0))  # Max 5 inches
                 else:
-                    height = Inches(base_height)
+                    height = _inches(base_height)
 
                 # Add text box with word wrap enabled
                 textbox = slide.shapes.add_textbox(left, top, width, height)
@@ -170,14 +232,12 @@ class PowerPointRenderer:
                 # Apply styling
                 self._apply_text_styling(text_frame, styling, gestalt_rules)
 
-    def _resolve_content(self, content_ref: str | None, lsp: dict[str, Any]) -> str | None:
+    def _resolve_content(self, content_ref: str | None, content_map: dict[str, str]) -> str | None:
         """Resolve content text from content_ref."""
         if not content_ref:
             return None
 
-        # Look up content in content_map
-        content_map = lsp.get("content_map", {})
-        return content_map.get(content_ref, f"[Missing content: {content_ref}]")
+        return content_map.get(content_ref)
 
     def _apply_text_styling(
         self, text_frame, styling: dict[str, Any], gestalt_rules: dict[str, Any]
@@ -191,32 +251,23 @@ class PowerPointRenderer:
             gestalt_rules: Gestalt rules with hierarchy info
         """
         paragraph = text_frame.paragraphs[0]
+        # .runs re-queries the paragraph XML on every access; the first run's
+        # font proxy is all the styling below needs
+        runs = paragraph.runs
+        font = runs[0].font if runs else None
 
         # Font styling
         font_config = styling.get("font", {})
-        if font_config and paragraph.runs:
-            font = paragraph.runs[0].font
+        if font_config and font is not None:
             if "size_pt" in font_config:
-                font.size = Pt(font_config["size_pt"])
-            if "weight" in font_config and font_config["weight"] == "bold":
+                font.size = _pt(font_config["size_pt"])
+            if font_config.get("weight") in _BOLD_WEIGHTS:
                 font.bold = True
 
         # Color
         color_hex = styling.get("color")
-        if color_hex and color_hex.startswith("#") and paragraph.runs:
-            rgb = self._hex_to_rgb(color_hex)
-            paragraph.runs[0].font.color.rgb = RGBColor(*rgb)
+        if color_hex and color_hex.startswith("#") and font is not None:
+            font.color.rgb = _hex_to_rgb(color_hex)
 
         # Alignment
-        alignment_map = {
-            "left": PP_ALIGN.LEFT,
-            "center": PP_ALIGN.CENTER,
-            "right": PP_ALIGN.RIGHT,
-        }
-        alignment = styling.get("alignment", "left")
-        paragraph.alignment = alignment_map.get(alignment, PP_ALIGN.LEFT)
-
-    def _hex_to_rgb(self, hex_color: str) -> tuple[int, int, int]:
-        """Convert hex color to RGB tuple."""
-        hex_color = hex_color.lstrip("#")
-        return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
+        paragraph.alignment = _ALIGNMENTS.get(styling.get("alignment", "left"), PP_ALIGN.LEFT)
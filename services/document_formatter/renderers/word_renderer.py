@@ -1,7 +1,9 @@
 """Word document renderer using python-docx."""
 
+import re
+from functools import lru_cache
 from typing import Any
-from uuid import uuid4
+from secrets import token_urlsafe
 from pathlib import Path
 import logging
 
@@ -9,8 +11,31 @@ from docx import Document
 from docx.shared import Pt, RGBColor, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
+from services.document_formatter.utils.paths import artifacts_dir
+
 logger = logging.getLogger(__name__)
 
+# Sentence boundary: terminal punctuation followed by whitespace (kept on the sentence)
+_SENTENCE_BOUNDARY_RE = re.compile(r"(?<=[.!?])\s+")
+
+_ALIGNMENTS = {
+    "left": WD_ALIGN_PARAGRAPH.LEFT,
+    "center": WD_ALIGN_PARAGRAPH.CENTER,
+    "right": WD_ALIGN_PARAGRAPH.RIGHT,
+    "justify": WD_ALIGN_PARAGRAPH.JUSTIFY,
+}
+
+# LSP font weights rendered as bold
+_BOLD_WEIGHTS = frozenset({"bold", "semibold"})
+
+
+@lru_cache(maxsize=256)
+def _hex_to_rgb(hex_color: str) -> RGBColor:
+    """Convert a #RRGGBB hex colour to an RGBColor; palettes repeat across runs."""
+    # bytes.fromhex parses all three channels in one C call; RGBColor is an
+    # immutable tuple, so cached instances are shared safely
+    return RGBColor(*bytes.fromhex(hex_color.lstrip("#")[:6]))
+
 
 class WordRenderer:
     """Renders Word documents from Layout Specification Packages."""
@@ -23,9 +48,7 @@ class WordRenderer:
             output_dir: Directory to save generated documents (defaults to infrastructure/data/artifacts)
         """
         if output_dir is None:
-            # Use absolute path relative to project root
-            project_root = Path(__file__).parent.parent.parent.parent.resolve()
-            output_dir = project_root / "infrastructure" / "data" / "artifacts"
+            output_dir = artifacts_dir()
         self.output_dir = Path(output_dir).resolve()
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -52,9 +75,15 @@ class WordRenderer:
         title = metadata.get("title", "Untitled Document")
         doc.core_properties.title = title
 
-        logger.info(f"Rendering Word document: {title} with {len(structure)} pages")
-        logger.debug(f"Content map has {len(lsp.get('content_map', {}))} entries: {list(lsp.get('content_map', {}).keys())[:5]}")
-        logger.debug(f"First structure unit has {len(structure[0].get('elements', [])) if structure else 0} elements")
+        logger.info("Rendering Word document: %s with %d pages", title, len(structure))
+        # The debug arguments walk the LSP, so skip building them unless enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            content_map = lsp.get("content_map", {})
+            logger.debug("Content map has %d entries: %s", len(content_map), list(content_map)[:5])
+            logger.debug(
+                "First structure unit has %d elements",
+                len(structure[0].get("elements", [])) if structure else 0,
+            )
 
         # Iterate through structure units (pages/sections)
         for unit_idx, unit in enumerate(structure):
@@ -76,12 +105,12 @@ class WordRenderer:
                 doc.add_page_break()
 
         # Generate artifact ID and save
-        artifact_id = f"artifact-word-{uuid4().hex[:8]}"
+        artifact_id = f"artifact-word-{token_urlsafe(6)}"
         output_path = self.output_dir / f"{artifact_id}.docx"
 
         doc.save(str(output_path))
 
-        logger.info(f"Word document saved: {output_path} (artifact_id: {artifact_id})")
+        logger.info("Word document saved: %s (artifact_id: %s)", output_path, artifact_id)
 
         return artifact_id
 
@@ -104,9 +133,12 @@ class WordRenderer:
         # Resolve content from CIP if content_ref is provided
         content_text = self._resolve_content(content_ref, lsp)
 
-        if not content_text or content_text.startswith("[Missing content"):
-            logger.warning(f"Skipping element with missing content: content_ref={content_ref}, "
-                         f"content_map_keys={list(lsp.get('content_map', {}).keys())[:5]}")
+        if not content_text:
+            logger.warning(
+                "Skipping element with missing content: content_ref=%s, content_map_keys=%s",
+                content_ref,
+                list(lsp.get("content_map", {}))[:5],
+            )
             return
 
         if element_type == "text":
@@ -117,8 +149,7 @@ class WordRenderer:
             # Split on sentence boundaries (period + space, but preserve the period)
             if len(content_text) > 500 and hierarchy_level >= 4:
                 # Split into sentences (simple heuristic: period followed by space or end)
-                import re
-                sentences = re.split(r'(?<=[.!?])\s+', content_text)
+                sentences = _SENTENCE_BOUNDARY_RE.split(content_text)
                 # Filter out empty sentences
                 sentences = [s.strip() for s in sentences if s.strip()]
                 
@@ -161,14 +192,14 @@ class WordRenderer:
             lsp: LSP containing content
 
         Returns:
-            Content text or None
+            Content text, or None if there is no ref or it is not in the content map
         """
         if not content_ref:
             return None
 
         # Look up content in content_map
         content_map = lsp.get("content_map", {})
-        return content_map.get(content_ref, f"[Missing content: {content_ref}]")
+        return content_map.get(content_ref)
 
     def _resolve_image_uri(self, image_id: str | None, lsp: dict[str, Any]) -> str | None:
         """Resolve image URI from image_id."""
@@ -187,34 +218,24 @@ class WordRenderer:
             paragraph: Paragraph object
             styling: Styling configuration
         """
-        # Font styling
+        # Resolve the run styling once, then apply it in a single pass
         font_config = styling.get("font", {})
-        if font_config:
+        size = Pt(font_config["size_pt"]) if "size_pt" in font_config else None
+        bold = font_config.get("weight") in _BOLD_WEIGHTS
+        color_hex = styling.get("color")
+        color = _hex_to_rgb(color_hex) if color_hex and color_hex.startswith("#") else None
+
+        if size is not None or bold or color is not None:
             for run in paragraph.runs:
                 font = run.font
-                if "size_pt" in font_config:
-                    font.size = Pt(font_config["size_pt"])
-                if "weight" in font_config and font_config["weight"] == "bold":
+                if size is not None:
+                    font.size = size
+                if bold:
                     font.bold = True
-
-        # Color
-        color_hex = styling.get("color")
-        if color_hex and color_hex.startswith("#"):
-            rgb = self._hex_to_rgb(color_hex)
-            for run in paragraph.runs:
-                run.font.color.rgb = RGBColor(*rgb)
+                if color is not None:
+                    font.color.rgb = color
 
         # Alignment
-        alignment_map = {
-            "left": WD_ALIGN_PARAGRAPH.LEFT,
-            "center": WD_ALIGN_PARAGRAPH.CENTER,
-            "right": WD_ALIGN_PARAGRAPH.RIGHT,
-            "justify": WD_ALIGN_PARAGRAPH.JUSTIFY,
-        }
-        alignment = styling.get("alignment", "left")
-        paragraph.alignment = alignment_map.get(alignment, WD_ALIGN_PARAGRAPH.LEFT)
-
-    def _hex_to_rgb(self, hex_color: str) -> tuple[int, int, int]:
-        """Convert hex color to RGB tuple."""
-        hex_color = hex_color.lstrip("#")
-        return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
+        paragraph.alignment = _ALIGNMENTS.get(
+            styling.get("alignment", "left"), WD_ALIGN_PARAGRAPH.LEFT
+        )
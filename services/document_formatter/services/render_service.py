@@ -1,10 +1,54 @@
 """Render service business logic."""
 
+import asyncio
+import hashlib
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
+import orjson
+
 from services.document_formatter.models.job import RenderJob, RenderJobStatus, FileType
 from services.document_formatter.renderers.word_renderer import WordRenderer
 from services.document_formatter.renderers.pptx_renderer import PowerPointRenderer
+from services.document_formatter.utils.logging import setup_logging
+from services.document_formatter.utils.paths import artifacts_dir
+
+# Jobs are only kept for status polling; the oldest are dropped past this many
+MAX_TRACKED_JOBS = 10_000
+
+# Identical LSPs (e.g. a re-submitted proposal) reuse the artifact rendered for
+# the most recent of this many distinct inputs
+MAX_CACHED_RENDERS = 256
+
+# Jobs that have not finished and can still be cancelled
+_CANCELLABLE_STATUSES = frozenset({RenderJobStatus.QUEUED, RenderJobStatus.PROCESSING})
+
+
+@lru_cache(maxsize=None)
+def _renderer(file_type: FileType) -> WordRenderer | PowerPointRenderer:
+    """Get the renderer for a file type, created once per worker process."""
+    return WordRenderer() if file_type is FileType.DOCX else PowerPointRenderer()
+
+
+def _render_artifact(file_type: FileType, lsp: dict[str, Any]) -> str:
+    """
+    Render one artifact inside a render worker process.
+
+    The renderers are coroutines but do no I/O worth awaiting, so each job
+    runs to completion on the worker's own event loop.
+
+    Args:
+        file_type: Output file type
+        lsp: Layout Specification Package
+
+    Returns:
+        Artifact ID of the saved file
+    """
+    return asyncio.run(_renderer(file_type).render(lsp))
 
 
 class RenderService:
@@ -12,59 +56,56 @@ class RenderService:
 
     def __init__(self) -> None:
         """Initialize render service."""
-        self._jobs: dict[str, RenderJob] = {}
-        self._word_renderer = WordRenderer()
-        self._pptx_renderer = PowerPointRenderer()
+        # Insertion-ordered so the oldest job is evicted first; each job holds
+        # its full LSP, so an unbounded map grows with every render
+        self._jobs: OrderedDict[str, RenderJob] = OrderedDict()
         # Track artifact IDs for lookup
-        self._artifact_to_job: dict[str, str] = {}
+        self._artifact_to_job: OrderedDict[str, str] = OrderedDict()
+        # Content hash of (file type, LSP) -> artifact ID rendered from it
+        self._rendered: OrderedDict[str, str] = OrderedDict()
+        self._queue: asyncio.Queue[tuple[RenderJob, FileType]] = asyncio.Queue()
+        self._workers: list[asyncio.Task[None]] = []
+        self._executor: ProcessPoolExecutor | None = None
+
+    async def start(self, workers: int) -> None:
+        """
+        Start the render worker pool.
+
+        python-docx and python-pptx are synchronous and CPU-bound, so jobs run
+        in separate processes and never block the event loop.
+
+        Args:
+            workers: Number of jobs rendered concurrently
+        """
+        if self._workers:
+            return
+        # spawn rather than fork: the service already runs a logging thread.
+        # Spawned workers start with bare logging, so each one configures its
+        # own handlers before taking jobs.
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=setup_logging,
+        )
+        self._workers = [asyncio.create_task(self._work()) for _ in range(workers)]
+
+    async def stop(self) -> None:
+        """Stop the render workers, abandoning queued jobs."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
     async def render_document(self, lsp: dict[str, Any]) -> RenderJob:
-        """Render Word document from LSP."""
-        # Validate LSP
-        if not self._validate_lsp(lsp):
-            raise ValueError("Invalid LSP: missing required fields")
-
-        # Create job
-        job = RenderJob(layout_specification=lsp)
-        self._jobs[job.render_job_id] = job
-
-        # Render document (synchronous for v1, async job queue in production)
-        try:
-            job.status = RenderJobStatus.PROCESSING
-            artifact_id = await self._word_renderer.render(lsp)
-            job.artifact_id = artifact_id
-            job.status = RenderJobStatus.COMPLETE
-            # Track artifact for lookup
-            self._artifact_to_job[artifact_id] = job.render_job_id
-        except Exception as e:
-            job.status = RenderJobStatus.FAILED
-            job.error = str(e)
-
-        return job
+        """Queue a Word document render from LSP."""
+        return self._submit(lsp, FileType.DOCX)
 
     async def render_presentation(self, lsp: dict[str, Any]) -> RenderJob:
-        """Render PowerPoint presentation from LSP."""
-        # Validate LSP
-        if not self._validate_lsp(lsp):
-            raise ValueError("Invalid LSP: missing required fields")
-
-        # Create job
-        job = RenderJob(layout_specification=lsp)
-        self._jobs[job.render_job_id] = job
-
-        # Render presentation
-        try:
-            job.status = RenderJobStatus.PROCESSING
-            artifact_id = await self._pptx_renderer.render(lsp)
-            job.artifact_id = artifact_id
-            job.status = RenderJobStatus.COMPLETE
-            # Track artifact for lookup
-            self._artifact_to_job[artifact_id] = job.render_job_id
-        except Exception as e:
-            job.status = RenderJobStatus.FAILED
-            job.error = str(e)
-
-        return job
+        """Queue a PowerPoint presentation render from LSP."""
+        return self._submit(lsp, FileType.PPTX)
 
     async def get_job(self, render_job_id: str) -> RenderJob | None:
         """Retrieve job by ID."""
@@ -73,9 +114,93 @@ class RenderService:
     async def cancel_job(self, render_job_id: str) -> None:
         """Cancel a render job."""
         job = self._jobs.get(render_job_id)
-        if job and job.status in [RenderJobStatus.QUEUED, RenderJobStatus.PROCESSING]:
+        if job and job.status in _CANCELLABLE_STATUSES:
             job.status = RenderJobStatus.CANCELLED
 
+    def _submit(self, lsp: dict[str, Any], file_type: FileType) -> RenderJob:
+        """
+        Validate an LSP and queue a render job for it.
+
+        Raises:
+            ValueError: If the LSP is missing required fields
+        """
+        if not self._validate_lsp(lsp):
+            raise ValueError("Invalid LSP: missing required fields")
+
+        job = RenderJob(layout_specification=lsp)
+        self._track(self._jobs, job.render_job_id, job)
+        self._queue.put_nowait((job, file_type))
+        return job
+
+    async def _work(self) -> None:
+        """Render queued jobs one at a time until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            job, file_type = await self._queue.get()
+            try:
+                if job.status is RenderJobStatus.CANCELLED:
+                    continue
+                job.status = RenderJobStatus.PROCESSING
+                render_key = self._render_key(file_type, job.layout_specification)
+                artifact_id = await self._cached_artifact(render_key, file_type)
+                if artifact_id is None:
+                    artifact_id = await loop.run_in_executor(
+                        self._executor, _render_artifact, file_type, job.layout_specification
+                    )
+                    self._track(self._rendered, render_key, artifact_id, MAX_CACHED_RENDERS)
+                job.artifact_id = artifact_id
+                # Track artifact for lookup
+                self._track(self._artifact_to_job, artifact_id, job.render_job_id)
+                if job.status is not RenderJobStatus.CANCELLED:
+                    job.status = RenderJobStatus.COMPLETE
+            except Exception as e:
+                job.status = RenderJobStatus.FAILED
+                job.error = str(e)
+            finally:
+                job.completed_at = datetime.utcnow()
+                self._queue.task_done()
+
+    async def _cached_artifact(self, render_key: str, file_type: FileType) -> str | None:
+        """
+        Find a previously rendered artifact for the same input.
+
+        Artifacts are immutable, so the cached artifact ID is returned as-is
+        rather than copied under a new one.
+
+        Args:
+            render_key: Content hash from _render_key
+            file_type: Output file type
+
+        Returns:
+            Artifact ID, or None on a miss or if the file is no longer on disk
+        """
+        artifact_id = self._rendered.get(render_key)
+        if artifact_id is None:
+            return None
+        path = artifacts_dir() / f"{artifact_id}.{file_type.value}"
+        if not await asyncio.to_thread(path.is_file):
+            del self._rendered[render_key]
+            return None
+        self._rendered.move_to_end(render_key)
+        return artifact_id
+
+    @staticmethod
+    def _render_key(file_type: FileType, lsp: dict[str, Any]) -> str:
+        """Hash a render input; key order in the LSP does not affect the result."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(file_type.value.encode())
+        digest.update(orjson.dumps(lsp, option=orjson.OPT_SORT_KEYS))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _track(
+        registry: OrderedDict[str, Any], key: str, value: Any, max_entries: int = MAX_TRACKED_JOBS
+    ) -> None:
+        """Record an entry, evicting the oldest once max_entries is exceeded."""
+        registry[key] = value
+        if len(registry) > max_entries:
+            registry.popitem(last=False)
+
     def _validate_lsp(self, lsp: dict[str, Any]) -> bool:
         """Validate LSP structure."""
         required_fields = ["schema_version", "proposal_id", "session_id", "document_type", "structure"]
@@ -1,6 +1,9 @@
 """Configuration management for Document Formatter Service."""
 
-from pydantic_settings import BaseSettings
+import os
+from functools import cached_property
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, field_validator
 
 
@@ -11,25 +14,37 @@ class Settings(BaseSettings):
     SERVICE_VERSION: str = Field(..., alias="FORMATTER_SERVICE_VERSION", description="Service version")
     PORT: int = Field(..., alias="DOCUMENT_FORMATTER_PORT", description="Service port")
     LOG_LEVEL: str = Field(..., alias="FORMATTER_LOG_LEVEL", description="Logging level")
+    LOG_FORMAT: str = Field(
+        default="text",
+        alias="FORMATTER_LOG_FORMAT",
+        pattern=r"^(text|json)$",
+        description="Log line format: text or json (one JSON object per line)",
+    )
     CORS_ORIGINS: str = Field(..., alias="FORMATTER_CORS_ORIGINS", description="Allowed CORS origins (comma-separated)")
     
-    @property
+    @cached_property
     def cors_origins_list(self) -> list[str]:
-        """Get CORS origins as list (for FastAPI CORS middleware)."""
+        """Get CORS origins as list (for FastAPI CORS middleware), parsed once per settings instance."""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",") if origin.strip()]
 
+    RENDER_WORKERS: int = Field(
+        default_factory=lambda: os.cpu_count() or 1,
+        alias="FORMATTER_RENDER_WORKERS",
+        ge=1,
+        description="Render jobs processed concurrently (defaults to the CPU count)",
+    )
+
     # Storage configuration
     STORAGE_BUCKET: str = Field(..., description="S3-compatible storage bucket")
     STORAGE_REGION: str = Field(..., description="Storage region")
 
-    class Config:
-        """Pydantic configuration."""
-
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = True
-        populate_by_name = True
-        extra = "ignore"  # Ignore extra environment variables not defined in this model
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        populate_by_name=True,
+        extra="ignore",  # Ignore extra environment variables not defined in this model
+    )
 
 
 settings = Settings()
@@ -0,0 +1,30 @@
+"""Filesystem locations shared by the Document Formatter Service."""
+
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=1)
+def project_root() -> Path:
+    """
+    Resolve the repository root.
+
+    services/document_formatter/utils/paths.py sits three directories below it.
+
+    Returns:
+        Absolute path to the project root
+    """
+    return Path(__file__).resolve().parents[3]
+
+
+@lru_cache(maxsize=1)
+def artifacts_dir() -> Path:
+    """
+    Locate the artifact storage directory, creating it on first use.
+
+    Returns:
+        Absolute path to infrastructure/data/artifacts
+    """
+    directory = project_root() / "infrastructure" / "data" / "artifacts"
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
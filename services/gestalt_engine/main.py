@@ -5,7 +5,9 @@ This service converts normalized content and intent metadata into detailed layou
 specifications that embody Gestalt and information design principles.
 """
 
-from fastapi import FastAPI
+import json
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from services.gestalt_engine.api import proposals
@@ -36,13 +38,18 @@ app.add_middleware(
 app.include_router(proposals.router, prefix="/v1/layout", tags=["proposals"])
 
 
+# Static probe bodies, encoded once instead of serialized on every hit
+_HEALTH_BODY = json.dumps({"status": "healthy", "service": "gestalt-engine"}).encode()
+_ROOT_BODY = json.dumps({"service": "Gestalt Design Engine", "version": "1.0.0"}).encode()
+
+
 @app.get("/health")
-async def health_check() -> dict[str, str]:
+async def health_check() -> Response:
     """Health check endpoint."""
-    return {"status": "healthy", "service": "gestalt-engine"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/")
-async def root() -> dict[str, str]:
+async def root() -> Response:
     """Root endpoint."""
-    return {"service": "Gestalt Design Engine", "version": "1.0.0"}
+    return Response(content=_ROOT_BODY, media_type="application/json")
@@ -1,19 +1,110 @@
-"""Structured logging configuration."""
+"""
+Structured logging configuration.
 
+Sets up JSON-formatted logging with correlation IDs for distributed tracing.
+"""
+
+import atexit
+import copy
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+import orjson
 
 from services.gestalt_engine.utils.config import settings
 
 
+# Background thread that writes queued log records; started by setup_logging
+_listener: QueueListener | None = None
+
+_TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+_TRACEBACK_FORMATTER = logging.Formatter()
+
+# Attributes every LogRecord has; anything else was passed through extra={}
+_RECORD_ATTRIBUTES = frozenset(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", None, None))
+) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format records as one JSON object per line.
+
+    Schema: {"ts": epoch seconds, "level": str, "logger": str, "message": str,
+    "exc": str (only with a traceback), ...fields passed via extra={}}.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serialize a log record with orjson."""
+        entry: dict[str, Any] = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        return orjson.dumps(entry, default=str).decode()
+
+
+class _RecordQueueHandler(QueueHandler):
+    """QueueHandler that keeps the traceback separate from the message."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Make a record safe to hand to the listener thread.
+
+        The stock implementation folds the traceback into the message; here
+        args are merged into the message and the traceback is rendered into
+        exc_text, which both formatters read.
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or _TRACEBACK_FORMATTER.formatException(
+                record.exc_info
+            )
+            record.exc_info = None
+        return record
+
+
 def setup_logging() -> None:
-    """Configure structured logging."""
-    logging.basicConfig(
-        level=getattr(logging, settings.LOG_LEVEL),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.StreamHandler(sys.stdout)],
+    """
+    Configure structured logging.
+
+    Log calls only enqueue the record; a background listener thread formats
+    it and writes to stdout, so request handlers never block on the stream.
+    Safe to call more than once.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        JsonFormatter() if settings.LOG_FORMAT == "json" else logging.Formatter(_TEXT_FORMAT)
     )
 
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root_logger = logging.getLogger()
+    root_logger.setLevel(getattr(logging, settings.LOG_LEVEL))
+    root_logger.addHandler(_RecordQueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    # Flush anything still queued when the process exits
+    atexit.register(_listener.stop)
+
 
 def get_logger(name: str) -> logging.Logger:
     """Get a configured logger instance."""
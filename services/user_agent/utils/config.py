@@ -1,6 +1,6 @@
 """Configuration management for User Agent."""
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -18,12 +18,11 @@ class Settings(BaseSettings):
     MAX_POLL_ATTEMPTS: int = 30
     POLL_INTERVAL_SECONDS: float = 2.0
 
-    class Config:
-        """Pydantic configuration."""
-
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = True
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+    )
 
 
 settings = Settings()
@@ -16,6 +16,8 @@ from rich.progress import Progress, TaskID
 from services.user_agent.workflow.state_machine import WorkflowState, WorkflowStateMachine
 from services.user_agent.utils.config import settings
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class WorkflowOrchestrator:
     """Orchestrates the end-to-end document generation workflow."""
@@ -66,20 +68,25 @@ class WorkflowOrchestrator:
             if progress and task:
                 progress.update(task, description="Retrieving layout specification...")
             lsp = await self._get_layout_spec(proposal_id)
+            # The LSP is only forwarded, so splice its bytes into the render
+            # request body once instead of decoding and re-encoding it
+            render_body = b'{"layout_specification":' + lsp + b"}"
 
-            # Step 5: Render documents
-            artifacts = []
+            # Step 5: Render documents (Word and PowerPoint are independent, so
+            # both jobs are queued and awaited at once)
+            renders: list[tuple[str, Any]] = []
             if output_format in ["word", "both"]:
-                if progress and task:
-                    progress.update(task, description="Rendering Word document...")
-                word_artifact = await self._render_document(lsp)
-                artifacts.append({"type": "word", "artifact_id": word_artifact["artifact_id"]})
-
+                renders.append(("word", self._render_document(render_body)))
             if output_format in ["pptx", "both"]:
-                if progress and task:
-                    progress.update(task, description="Rendering PowerPoint presentation...")
-                pptx_artifact = await self._render_presentation(lsp)
-                artifacts.append({"type": "powerpoint", "artifact_id": pptx_artifact["artifact_id"]})
+                renders.append(("powerpoint", self._render_presentation(render_body)))
+
+            if progress and task:
+                progress.update(task, description="Rendering documents...")
+            results = await asyncio.gather(*(render for _, render in renders))
+            artifacts = [
+                {"type": artifact_type, "artifact_id": result["artifact_id"]}
+                for (artifact_type, _), result in zip(renders, results)
+            ]
 
             self.state_machine.transition(WorkflowState.DELIVERED)
 
@@ -134,26 +141,46 @@ class WorkflowOrchestrator:
 
         raise TimeoutError("Layout generation timed out")
 
-    async def _get_layout_spec(self, proposal_id: str) -> dict[str, Any]:
-        """Get layout specification."""
+    async def _poll_render_job(
+        self, render_job_id: str, max_attempts: int = 60, interval: float = 1.0
+    ) -> dict[str, Any]:
+        """Poll a render job until its artifact is complete."""
+        url = f"{settings.DOCUMENT_FORMATTER_URL}/render/jobs/{render_job_id}"
+
+        for _ in range(max_attempts):
+            response = await self.client.get(url)
+            response.raise_for_status()
+            data = response.json()
+
+            if data["status"] == "complete":
+                return data
+            elif data["status"] in ("failed", "cancelled"):
+                raise RuntimeError(f"Render job {render_job_id} {data['status']}: {data.get('error')}")
+
+            await asyncio.sleep(interval)
+
+        raise TimeoutError(f"Render job {render_job_id} timed out")
+
+    async def _get_layout_spec(self, proposal_id: str) -> bytes:
+        """Get layout specification as undecoded JSON bytes."""
         url = f"{settings.GESTALT_ENGINE_URL}/layout/proposals/{proposal_id}/spec"
         response = await self.client.get(url)
         response.raise_for_status()
-        return response.json()
+        return response.content
 
-    async def _render_document(self, lsp: dict[str, Any]) -> dict[str, Any]:
-        """Render Word document."""
+    async def _render_document(self, body: bytes) -> dict[str, Any]:
+        """Render Word document from a pre-encoded render request body and wait for it."""
         url = f"{settings.DOCUMENT_FORMATTER_URL}/render/documents"
-        response = await self.client.post(url, json={"layout_specification": lsp})
+        response = await self.client.post(url, content=body, headers=_JSON_HEADERS)
         response.raise_for_status()
-        return response.json()
+        return await self._poll_render_job(response.json()["render_job_id"])
 
-    async def _render_presentation(self, lsp: dict[str, Any]) -> dict[str, Any]:
-        """Render PowerPoint presentation."""
+    async def _render_presentation(self, body: bytes) -> dict[str, Any]:
+        """Render PowerPoint presentation from a pre-encoded render request body and wait for it."""
         url = f"{settings.DOCUMENT_FORMATTER_URL}/render/presentations"
-        response = await self.client.post(url, json={"layout_specification": lsp})
+        response = await self.client.post(url, content=body, headers=_JSON_HEADERS)
         response.raise_for_status()
-        return response.json()
+        return await self._poll_render_job(response.json()["render_job_id"])
 
     async def close(self) -> None:
         """Close HTTP client."""
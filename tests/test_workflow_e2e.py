@@ -39,6 +39,18 @@ Overall, this layered architecture ensures that data storage, business logic, in
 The main business benefit of this architecture is its ability to provide banks with a highly scalable, flexible, and reliable core banking system that can be tailored to diverse operational needs while ensuring consistent data integrity and seamless integration across multiple channels. This empowers banks to innovate rapidly and deliver superior customer experiences."""
 
 
+async def wait_for_render_job(client: httpx.AsyncClient, job: dict) -> dict:
+    """Poll a queued render job until it finishes."""
+    for _ in range(60):
+        response = await client.get(f"{DOCUMENT_FORMATTER_URL}/jobs/{job['render_job_id']}")
+        response.raise_for_status()
+        job = response.json()
+        if job["status"] in ("complete", "failed", "cancelled"):
+            return job
+        await asyncio.sleep(0.5)
+    return job
+
+
 async def test_workflow():
     """Run end-to-end workflow test."""
     async with httpx.AsyncClient(timeout=120.0) as client:
@@ -146,7 +158,7 @@ async def test_workflow():
             json={"layout_specification": lsp}
         )
         response.raise_for_status()
-        word_job = response.json()
+        word_job = await wait_for_render_job(client, response.json())
         word_artifact_id = word_job.get("artifact_id")
         print(f"✓ Word document rendered")
         print(f"  Job ID: {word_job.get('render_job_id')}")
@@ -163,7 +175,7 @@ async def test_workflow():
             json={"layout_specification": lsp_pptx}
         )
         response.raise_for_status()
-        pptx_job = response.json()
+        pptx_job = await wait_for_render_job(client, response.json())
         pptx_artifact_id = pptx_job.get("artifact_id")
         print(f"✓ PowerPoint presentation rendered")
         print(f"  Job ID: {pptx_job.get('render_job_id')}")
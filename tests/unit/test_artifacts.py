@@ -0,0 +1,57 @@
+"""Unit tests for artifact lookup in the Document Formatter API."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from services.document_formatter.api import artifacts
+from services.document_formatter.models.job import FileType
+
+
+@pytest.fixture
+def artifact_dirs(tmp_path, monkeypatch):
+    """Point the artifact API at empty directories with an empty index."""
+    new_dir = tmp_path / "artifacts"
+    old_dir = tmp_path / "old"
+    new_dir.mkdir()
+    old_dir.mkdir()
+    monkeypatch.setattr(artifacts, "ARTIFACTS_DIR", new_dir)
+    monkeypatch.setattr(artifacts, "_OLD_ARTIFACTS_DIR", old_dir)
+    monkeypatch.setattr(artifacts, "_ARTIFACT_INDEX", {})
+    return new_dir
+
+
+def _download_request() -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+
+
+def test_indexed_artifact_is_served(artifact_dirs) -> None:
+    """Test an artifact on disk is found and its metadata returned."""
+    (artifact_dirs / "artifact-word-abc.docx").write_bytes(b"docx")
+
+    response = asyncio.run(artifacts.get_artifact("artifact-word-abc"))
+
+    assert response.file_type == FileType.DOCX
+    assert response.size_bytes == 4
+    assert "artifact-word-abc" in artifacts._ARTIFACT_INDEX
+
+
+def test_deleted_artifact_returns_404_and_leaves_index(artifact_dirs) -> None:
+    """Test a file removed after indexing is a 404, not a 500, and is un-indexed."""
+    path = artifact_dirs / "artifact-word-abc.docx"
+    path.write_bytes(b"docx")
+    asyncio.run(artifacts.get_artifact("artifact-word-abc"))
+    path.unlink()
+
+    with pytest.raises(HTTPException) as metadata_error:
+        asyncio.run(artifacts.get_artifact("artifact-word-abc"))
+    assert metadata_error.value.status_code == 404
+    assert "artifact-word-abc" not in artifacts._ARTIFACT_INDEX
+
+    artifacts._ARTIFACT_INDEX["artifact-word-abc"] = (path, FileType.DOCX)
+    with pytest.raises(HTTPException) as download_error:
+        asyncio.run(artifacts.download_artifact("artifact-word-abc", _download_request()))
+    assert download_error.value.status_code == 404
+    assert "artifact-word-abc" not in artifacts._ARTIFACT_INDEX
@@ -0,0 +1,63 @@
+"""Unit tests for the request body size limit middleware."""
+
+import asyncio
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from services.content_intake.utils.body_limit import BodySizeLimitMiddleware
+
+
+async def _echo_length(scope, receive, send) -> None:
+    """ASGI app that reads the whole body and reports its length."""
+    body = await Request(scope, receive).body()
+    await JSONResponse({"length": len(body)})(scope, receive, send)
+
+
+def _call(app, chunks: list[bytes], headers: list[tuple[bytes, bytes]]) -> list[dict]:
+    """Drive an ASGI app with a streamed request and collect what it sends."""
+    scope = {"type": "http", "method": "POST", "path": "/", "headers": headers}
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+    sent: list[dict] = []
+
+    async def receive() -> dict:
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return sent
+
+
+def test_content_length_over_limit_is_rejected() -> None:
+    """Test a declared oversized body is rejected before it is read."""
+    app = BodySizeLimitMiddleware(_echo_length, max_body_bytes=10)
+
+    sent = _call(app, [b"x" * 20], [(b"content-length", b"20")])
+
+    assert sent[0]["status"] == 413
+
+
+def test_chunked_body_over_limit_is_rejected() -> None:
+    """Test a body without Content-Length gets a single 413 once it passes the limit."""
+    app = BodySizeLimitMiddleware(_echo_length, max_body_bytes=10)
+
+    sent = _call(app, [b"x" * 6, b"x" * 6, b"x" * 6], [])
+
+    starts = [m for m in sent if m["type"] == "http.response.start"]
+    assert [m["status"] for m in starts] == [413]
+    assert b"exceeds 10 bytes" in sent[-1]["body"]
+
+
+def test_chunked_body_within_limit_passes_through() -> None:
+    """Test a streamed body under the limit reaches the app intact."""
+    app = BodySizeLimitMiddleware(_echo_length, max_body_bytes=10)
+
+    sent = _call(app, [b"x" * 4, b"x" * 4], [])
+
+    assert sent[0]["status"] == 200
+    assert sent[-1]["body"] == b'{"length":8}'
@@ -0,0 +1,19 @@
+"""Guard against the per-service logging setups drifting apart."""
+
+from pathlib import Path
+
+SERVICES_DIR = Path(__file__).resolve().parents[2] / "services"
+SERVICES = ("content_intake", "document_formatter", "gestalt_engine")
+
+
+def _logging_source(service: str) -> str:
+    """Read a service's logging module with its own settings import normalized."""
+    source = (SERVICES_DIR / service / "utils" / "logging.py").read_text()
+    return source.replace(f"services.{service}.utils.config", "services.SERVICE.utils.config")
+
+
+def test_service_logging_modules_are_identical() -> None:
+    """Test every service ships the same logging setup, apart from its settings import."""
+    reference = _logging_source(SERVICES[0])
+    for service in SERVICES[1:]:
+        assert _logging_source(service) == reference, f"{service}/utils/logging.py has drifted"
@@ -0,0 +1,50 @@
+"""Unit tests for the in-process TTL cache."""
+
+from services.content_intake.utils import cache as cache_module
+from services.content_intake.utils.cache import TTLCache
+
+
+def test_get_returns_cached_value() -> None:
+    """Test values round-trip until they expire."""
+    cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("missing") is None
+    assert cache.get("missing", 0) == 0
+
+
+def test_entries_expire(monkeypatch) -> None:
+    """Test entries are dropped once their TTL has passed."""
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=30)
+
+    now[0] = 111.0
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert len(cache) == 1
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    """Test the cache stays within maxsize by evicting the LRU entry."""
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_pop_removes_entry() -> None:
+    """Test pop returns the value and removes it."""
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+
+    assert cache.pop("a") == 1
+    assert cache.get("a") is None